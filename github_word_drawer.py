@@ -7,10 +7,32 @@ that form the word pattern on the GitHub contribution graph (7 rows × N columns
 """
 
 import argparse
+import contextlib
+import csv
+import functools
+import hashlib
+import itertools
+import json
+import mmap
+import os
+import re
+import signal
+import struct
 import subprocess
 import sys
-from datetime import datetime, timedelta
-from typing import List, Dict
+import threading
+import time
+import zlib
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # only needed by --image
+    np = None
 
 # ASCII art patterns for letters (7 rows high, variable width)
 LETTER_PATTERNS = {
@@ -260,84 +282,1102 @@ LETTER_PATTERNS = {
 }
 
 
-class GitHubWordDrawer:
-    def __init__(self, word: str, start_date: str = None, commits_per_date: int = 5):
-        self.word = word.upper()
-        self.start_date = self._parse_start_date(start_date)
-        self.commits_per_date = commits_per_date
+COMMIT_FILE = "word_pattern.txt"
+
+# What each commit writes to COMMIT_FILE: a unique counter text per commit,
+# nothing (empty commits sharing one tree), one constant blob, or a log that
+# grows by a line per commit and delta-compresses well
+CONTENT_STRATEGIES = ['counter', 'empty', 'constant', 'append-log']
+
+CONSTANT_CONTENT = "Drawing pattern on GitHub contribution graph\n"
+
+# Days shown by the contribution graph (53 weeks)
+GRAPH_DAYS = 53 * 7
+
+# Private refs mapping a plan fingerprint to the tip the plan produced
+CACHE_REF_PREFIX = "refs/word-drawer/cache/"
+
+# Number of lit days in each 7-bit week column mask
+POPCOUNT = bytes(bin(mask).count('1') for mask in range(128))
+
+
+class BitmapFont:
+    """A font compiled once into per-glyph week column masks (bit 0 = Sunday)."""
+
+    def __init__(self, patterns: Dict[str, List[str]], name: str = 'builtin'):
+        self.name = name
+        self.glyphs = {
+            char: bytes(sum(1 << row for row in range(7) if rows[row][col] == '█')
+                        for col in range(len(rows[0])))
+            for char, rows in patterns.items()
+        }
+        self.weights = {char: sum(POPCOUNT[mask] for mask in glyph)
+                        for char, glyph in self.glyphs.items()}
+
+    def covers(self, char: str) -> bool:
+        return char in self.glyphs or char.upper() in self.glyphs
+
+    def glyph(self, char: str) -> bytes:
+        """Column masks of a character; unknown characters default to space."""
+        return self.glyphs.get(char, self.glyphs[' '])
+
+    def weight(self, char: str) -> int:
+        """Number of lit cells in a character."""
+        return self.weights.get(char, self.weights[' '])
+
+    def __repr__(self):
+        return f"BitmapFont({self.name!r})"
+
+
+@functools.lru_cache(maxsize=512)
+def compose_word(text: str, font: BitmapFont) -> bytes:
+    """Rasterize text into column masks with one blank column between glyphs.
+
+    Multi-word text is composed from its memoized words, so batches and
+    repeated previews only rasterize each distinct word once.
+    """
+    words = text.split(' ')
+    if len(words) > 1 and all(words):
+        space = font.glyph(' ')
+        return (b"\0" + space + b"\0").join(compose_word(word, font) for word in words)
+    return b"\0".join(font.glyph(char) for char in text)
+
+
+DEFAULT_FONT = BitmapFont(LETTER_PATTERNS)
+
+
+class GlyphAtlas:
+    """A compiled font, memory-mapped and searched by codepoint.
+
+    The atlas is a 'WDFA' header with the glyph count, a table of
+    (codepoint, offset, width, weight) entries sorted by codepoint, then
+    every glyph's column masks. Only the glyphs a word uses are ever read,
+    so opening a large Unicode font costs the same as a small one.
+    """
+
+    MAGIC = b'WDFA'
+    ENTRY = struct.Struct('>IIHH')
+
+    def __init__(self, path: str, name: str = None):
+        self.name = name or os.path.basename(path)
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:4] != self.MAGIC:
+            raise ValueError(f"{path}: not a glyph atlas")
+        self.count, = struct.unpack_from('>I', self.map, 4)
+        self.data_start = 8 + self.count * self.ENTRY.size
+        self.found = {}
+
+    def _find(self, char: str):
+        """(offset, width, weight) of a character, trying its other case too, or None."""
+        if char not in self.found:
+            self.found[char] = None
+            for candidate in dict.fromkeys((char, char.upper(), char.lower())):
+                if len(candidate) != 1:
+                    continue
+                codepoint, low, high = ord(candidate), 0, self.count
+                while low < high:
+                    middle = (low + high) // 2
+                    code, offset, width, weight = self.ENTRY.unpack_from(self.map, 8 + middle * self.ENTRY.size)
+                    if code < codepoint:
+                        low = middle + 1
+                    elif code > codepoint:
+                        high = middle
+                    else:
+                        self.found[char] = (offset, width, weight)
+                        break
+                if self.found[char]:
+                    break
+        return self.found[char]
+
+    def covers(self, char: str) -> bool:
+        return self._find(char) is not None
+
+    def glyph(self, char: str) -> bytes:
+        """Column masks of a character; unknown characters default to space."""
+        entry = self._find(char) or self._find(' ')
+        if entry is None:
+            return bytes(3)
+        offset, width, _ = entry
+        return self.map[self.data_start + offset:self.data_start + offset + width]
+
+    def weight(self, char: str) -> int:
+        """Number of lit cells in a character."""
+        entry = self._find(char) or self._find(' ')
+        return entry[2] if entry else 0
+
+    def __repr__(self):
+        return f"GlyphAtlas({self.name!r})"
+
+
+def _fold_rows(rows: List[int], width: int) -> bytes:
+    """Turn glyph rows (bit i = column i) into 7-row column masks, merging rows of taller fonts."""
+    height = len(rows)
+    bands = [0] * 7
+    for row, bits in enumerate(rows):
+        bands[row * 7 // height if height > 7 else row] |= bits
+    return bytes(sum(1 << row for row in range(7) if bands[row] >> col & 1) for col in range(width))
+
+
+def _parse_bdf(path: str) -> Dict[int, bytes]:
+    """Read a BDF font into column masks per codepoint, aligned on the font's ascent."""
+    glyphs = {}
+    ascent = descent = None
+    with open(path, encoding='latin-1') as f:
+        lines = iter(f)
+        for line in lines:
+            fields = line.split()
+            if not fields:
+                continue
+            if fields[0] == 'FONTBOUNDINGBOX' and ascent is None:
+                ascent, descent = int(fields[2]) + int(fields[4]), -int(fields[4])
+            elif fields[0] == 'FONT_ASCENT':
+                ascent = int(fields[1])
+            elif fields[0] == 'FONT_DESCENT':
+                descent = int(fields[1])
+            elif fields[0] == 'STARTCHAR':
+                codepoint, advance, box, bitmap = -1, 0, (0, 0, 0, 0), []
+                for line in lines:
+                    fields = line.split()
+                    if not fields:
+                        continue
+                    if fields[0] == 'ENCODING':
+                        codepoint = int(fields[1])
+                    elif fields[0] == 'DWIDTH':
+                        advance = int(fields[1])
+                    elif fields[0] == 'BBX':
+                        box = tuple(int(value) for value in fields[1:5])
+                    elif fields[0] == 'BITMAP':
+                        for line in lines:
+                            if line.startswith('ENDCHAR'):
+                                break
+                            bitmap.append(line.strip())
+                        break
+                if codepoint < 0:
+                    continue
+
+                width, height, x_offset, y_offset = box
+                x_offset = max(x_offset, 0)
+                rows = [0] * (ascent + descent)
+                top = ascent - height - y_offset
+                for row, hex_row in enumerate(bitmap):
+                    if 0 <= top + row < len(rows) and hex_row:
+                        bits = int(hex_row, 16) >> (len(hex_row) * 4 - width)
+                        # BDF rows are most significant bit first
+                        rows[top + row] = sum(1 << (x_offset + col) for col in range(width)
+                                              if bits >> (width - 1 - col) & 1)
+                columns = x_offset + width if any(rows) else max(advance, 1)
+                glyphs[codepoint] = _fold_rows(rows, columns)
+    return glyphs
+
+
+def _parse_simple_font(path: str) -> Dict[int, bytes]:
+    """Read a simple bitmap font: '= X' (or '= U+XXXX') lines, each followed by its rows.
+
+    A bare '= ' header declares the space glyph.
+
+    Rows use '█' or '#' for lit cells; a glyph is as wide as its longest row.
+    """
+    glyphs, char, rows = {}, None, []
+
+    def finish():
+        if char is not None:
+            width = max((len(row) for row in rows), default=1)
+            glyphs[char] = _fold_rows([sum(1 << col for col, cell in enumerate(row) if cell in '█#')
+                                       for row in rows] or [0], width)
+
+    with open(path, encoding='utf-8') as f:
+        for number, line in enumerate(f, start=1):
+            line = line.rstrip('\n')
+            if line == '=' or line.startswith('= '):
+                finish()
+                name, rows = line[2:], []
+                if not name:
+                    char = ord(' ')
+                elif name.upper().startswith('U+'):
+                    try:
+                        char = int(name[2:], 16)
+                    except ValueError:
+                        char = -1
+                    if not 0 <= char <= 0x10FFFF:
+                        raise ValueError(f"{path}: line {number}: bad codepoint {name!r}")
+                elif len(name) == 1:
+                    char = ord(name)
+                else:
+                    raise ValueError(f"{path}: line {number}: glyph header names one character or U+XXXX, "
+                                     f"not {name!r}")
+            elif char is not None:
+                rows.append(line)
+    finish()
+    return glyphs
+
+
+def compile_font(path: str, atlas_path: str):
+    """Compile a BDF or simple bitmap font into a glyph atlas file."""
+    with open(path, encoding='latin-1') as f:
+        is_bdf = f.readline().startswith('STARTFONT')
+    glyphs = _parse_bdf(path) if is_bdf else _parse_simple_font(path)
+    if not glyphs:
+        raise ValueError(f"{path}: no glyphs found")
+
+    table, data = [], bytearray()
+    for codepoint in sorted(glyphs):
+        masks = glyphs[codepoint]
+        table.append(GlyphAtlas.ENTRY.pack(codepoint, len(data), len(masks),
+                                           sum(POPCOUNT[mask] for mask in masks)))
+        data += masks
+
+    os.makedirs(os.path.dirname(atlas_path) or '.', exist_ok=True)
+    tmp = atlas_path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(GlyphAtlas.MAGIC + struct.pack('>I', len(table)) + b"".join(table) + data)
+    os.replace(tmp, atlas_path)
+
+
+def load_font(path: str) -> GlyphAtlas:
+    """Open a font, compiling it into a cached atlas the first time (or after it changes)."""
+    if path.endswith('.atlas'):
+        return GlyphAtlas(path)
+
+    info = os.stat(path)
+    key = hashlib.sha1(f"{os.path.abspath(path)}:{info.st_size}:{info.st_mtime_ns}".encode()).hexdigest()
+    cache_dir = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                             'github-word-drawer')
+    atlas_path = os.path.join(cache_dir, f"{key}.atlas")
+    if not os.path.isfile(atlas_path):
+        compile_font(path, atlas_path)
+    return GlyphAtlas(atlas_path, f"{os.path.basename(path)}@{key[:12]}")
+
+
+# Contribution graph colors for levels 0-4, as RGB, and their plain-text stand-ins
+GRAPH_COLORS = [(235, 237, 240), (155, 233, 168), (64, 196, 99), (48, 161, 78), (33, 110, 57)]
+GRAPH_SHADES = " ░▒▓█"
+
+
+def contribution_levels(counts: Sequence[int]) -> bytes:
+    """Shade level 0-4 of each day count the way the contribution graph does.
+
+    Days without commits are level 0; the others fall into quarters of the
+    busiest day's count.
+    """
+    busiest = max(counts, default=0)
+    if not busiest:
+        return bytes(len(counts))
+    return bytes(-(-4 * count // busiest) for count in counts)
+
+
+def level_commits(level: int, busiest: int, reached: bool = False) -> int:
+    """Fewest commits that show a day at level 0-4 on a graph whose busiest day has busiest.
+
+    Level L takes more than (L-1)/4 of the busiest count. Level 4 needs the
+    busiest count itself unless another day already reached it.
+    """
+    if not level:
+        return 0
+    if level >= 4 and not reached:
+        return busiest
+    return (level - 1) * busiest // 4 + 1
+
+
+# Characters a pattern file may use for each level
+PATTERN_LEVELS = {' ': 0, '.': 0, '0': 0, '░': 1, '1': 1, '▒': 2, '2': 2,
+                  '▓': 3, '3': 3, '█': 4, '4': 4, '#': 4}
+
+
+def load_pattern(path: str) -> bytes:
+    """Read a pattern file into one level (0-4) per cell, week column by week column.
+
+    The file has up to 7 lines, Sunday first, with one character per week
+    in the PATTERN_LEVELS alphabet.
+    """
+    with open(path, encoding='utf-8') as f:
+        rows = f.read().rstrip('\n').split('\n')
+    if len(rows) > 7:
+        raise ValueError(f"{path}: a pattern has at most 7 rows, found {len(rows)}")
+    rows += [''] * (7 - len(rows))
+
+    weeks = max(len(row) for row in rows)
+    levels = bytearray(weeks * 7)
+    for day, row in enumerate(rows):
+        for week, char in enumerate(row):
+            if char not in PATTERN_LEVELS:
+                raise ValueError(f"{path}: row {day + 1}: unknown pattern character {char!r}")
+            levels[week * 7 + day] = PATTERN_LEVELS[char]
+    return bytes(levels)
+
+
+# 4x4 Bayer matrix, as thresholds in (0, 1) for ordered dithering
+BAYER_4 = [[0, 8, 2, 10], [12, 4, 14, 6], [3, 11, 1, 9], [15, 7, 13, 5]]
+
+
+def _read_netpbm(path: str):
+    """Read a PBM or PGM file (plain or raw) as a float array of darkness in [0, 1]."""
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    magic = data[:2]
+    if magic not in (b'P1', b'P2', b'P4', b'P5'):
+        raise ValueError(f"{path}: not a PBM or PGM file")
+    # Header fields are whitespace separated and may be interleaved with comments
+    fields, pos = [], 2
+    while len(fields) < (2 if magic in (b'P1', b'P4') else 3):
+        match = re.compile(rb'\s*(?:#[^\n]*\n\s*)*(\d+)').match(data, pos)
+        if not match:
+            raise ValueError(f"{path}: truncated header")
+        fields.append(int(match.group(1)))
+        pos = match.end()
+    width, height = fields[:2]
+    maxval = fields[2] if len(fields) > 2 else 1
+    pos += 1  # the single whitespace byte ending the header
+
+    if magic == b'P4':
+        rows = np.frombuffer(data, np.uint8, height * ((width + 7) // 8), pos).reshape(height, -1)
+        return np.unpackbits(rows, axis=1)[:, :width].astype(np.float64)
+    if magic == b'P5':
+        dtype = np.dtype('>u2') if maxval > 255 else np.uint8
+        pixels = np.frombuffer(data, dtype, width * height, pos).reshape(height, width)
+    elif magic == b'P1':
+        # Plain PBM digits need not be separated
+        digits = re.sub(rb'#[^\n]*|\s', b'', data[pos - 1:])
+        return (np.frombuffer(digits, np.uint8, width * height) - ord('0')).reshape(height, width).astype(np.float64)
+    else:
+        pixels = np.array(re.sub(rb'#[^\n]*', b'', data[pos - 1:]).split(), dtype=np.int64).reshape(height, width)
+    # In PGM, 0 is black
+    return 1.0 - pixels.astype(np.float64) / maxval
+
+
+def _resample(image, size: int, axis: int):
+    """Average image down to size cells along axis (or repeat its pixels if it is smaller)."""
+    length = image.shape[axis]
+    if length < size:
+        return np.take(image, np.arange(size) * length // size, axis=axis)
+    starts = np.arange(size) * length // size
+    counts = np.diff(np.append(starts, length))
+    sums = np.add.reduceat(image, starts, axis=axis)
+    return sums / (counts[:, None] if axis == 0 else counts[None, :])
+
+
+def load_image(path: str, weeks: int = None, dither: bool = True) -> bytes:
+    """Convert an image into one level (0-4) per cell, week column by week column.
+
+    PBM and PGM files are read directly, other formats such as PNG need
+    Pillow. The image is averaged down to 7 rows and weeks columns (by
+    default keeping its aspect ratio, at most 53), and darker cells get
+    higher levels, with ordered dithering unless dither is False.
+    """
+    if np is None:
+        raise ValueError("importing images needs NumPy (pip install numpy)")
+
+    if path.lower().endswith(('.pbm', '.pgm')):
+        darkness = _read_netpbm(path)
+    else:
+        try:
+            from PIL import Image
+        except ImportError:
+            raise ValueError(f"{path}: only PBM and PGM images can be read without Pillow (pip install pillow)")
+        with Image.open(path) as image:
+            darkness = 1.0 - np.asarray(image.convert('L'), dtype=np.float64) / 255
+
+    height, width = darkness.shape
+    if not weeks:
+        weeks = min(53, max(1, round(width * 7 / height)))
+    cells = _resample(_resample(darkness, 7, 0), weeks, 1) * 4
+
+    if dither:
+        thresholds = (np.array(BAYER_4, dtype=np.float64) + 0.5) / 16
+        # A cell part way between two levels takes the upper one with that probability
+        cells = np.floor(cells + np.tile(thresholds, (2, -(-weeks // 4)))[:7, :weeks])
+    else:
+        cells = np.rint(cells)
+    # Week-major, Sunday first, like the word grids
+    return np.clip(cells, 0, 4).astype(np.uint8).T.tobytes()
+
+
+def render_graph(levels: bytes, first_day: datetime, ansi: bool = False) -> str:
+    """Lay day levels out as the graph's 7 rows of weeks, with month labels on top."""
+    weeks = -(-len(levels) // 7)
+    months = [" "] * (weeks * 2)
+    for week in range(weeks):
+        day = first_day + timedelta(weeks=week)
+        if day.day <= 7:
+            label = day.strftime('%b')
+            months[week * 2:week * 2 + len(label)] = label
+    lines = ["    " + "".join(months[:weeks * 2]).rstrip()]
+
+    for row in range(7):
+        cells = []
+        for week in range(weeks):
+            index = week * 7 + row
+            level = levels[index] if index < len(levels) else None
+            if level is None:
+                cells.append("  ")
+            elif ansi:
+                cells.append("\x1b[38;2;%d;%d;%dm■\x1b[0m " % GRAPH_COLORS[level])
+            else:
+                cells.append(GRAPH_SHADES[level] * 2)
+        label = (first_day + timedelta(days=row)).strftime('%a') if row % 2 else ""
+        lines.append(f"{label:<4}" + "".join(cells).rstrip())
+    return "\n".join(lines)
+
+
+# Seconds between two writes of the resume journal
+CHECKPOINT_INTERVAL = 5.0
+
+# Above this many commits the objects backend writes one packfile instead of loose objects
+PACK_THRESHOLD = 1000
+
+# Object type codes used in packfile entry headers
+PACK_TYPES = {b'commit': 1, b'tree': 2, b'blob': 3}
+
+
+def _find_git_dir(start: str = '.') -> str:
+    """Locate the repository's git directory without running git."""
+    if os.environ.get('GIT_DIR'):
+        return os.path.abspath(os.environ['GIT_DIR'])
+
+    path = os.path.abspath(start)
+    while True:
+        dot_git = os.path.join(path, '.git')
+        if os.path.isdir(dot_git):
+            return dot_git
+        if os.path.isfile(dot_git):
+            # Linked worktrees and submodules use a "gitdir: <path>" file
+            with open(dot_git) as f:
+                target = f.read().strip().split('gitdir:', 1)[1].strip()
+            return os.path.normpath(os.path.join(path, target))
+        parent = os.path.dirname(path)
+        if parent == path:
+            raise FileNotFoundError("Not inside a git repository")
+        path = parent
+
+
+def _common_dir(git_dir: str = None) -> str:
+    """Directory shared by all worktrees, holding objects, refs and config."""
+    git_dir = git_dir or _find_git_dir()
+    common = os.path.join(git_dir, 'commondir')
+    if os.path.isfile(common):
+        with open(common) as f:
+            return os.path.normpath(os.path.join(git_dir, f.read().strip()))
+    return git_dir
+
+
+class ObjectStore:
+    """Minimal in-process writer for a repository's object database and refs.
+
+    Objects are hashed synchronously (commit SHAs chain) and zlib-compressed on
+    a thread pool, since zlib releases the GIL. Small runs are written as loose
+    objects; large runs go into a single packfile with a version 2 index.
+    Only loose objects can be read back; packed objects fall back to one
+    `git cat-file` call, which is only ever needed for the base commit.
+    """
+
+    def __init__(self, git_dir: str = None, workers: int = None):
+        self.git_dir = git_dir or _find_git_dir()
+        self.common_dir = _common_dir(self.git_dir)
+        self.objects_dir = os.path.join(self.common_dir, 'objects')
+        self.pool = ThreadPoolExecutor(max_workers=workers or os.cpu_count())
+        self.pending = []
+        self.written = set()
+        self.pack = None
+        # Last few objects written, readable before their write has landed
+        self.recent = OrderedDict()
+
+    # -- objects ------------------------------------------------------------
 
-    def _parse_start_date(self, start_date: str) -> datetime:
-        """Parse start date or use a date from one year ago."""
-        if start_date:
-            return datetime.strptime(start_date, "%Y-%m-%d")
+    @staticmethod
+    def hash_object(obj_type: bytes, data: bytes) -> Tuple[str, bytes]:
+        """Return (hex SHA, raw object) for a blob, tree or commit body."""
+        raw = b"%s %d\0%s" % (obj_type, len(data), data)
+        return hashlib.sha1(raw).hexdigest(), raw
+
+    def write(self, obj_type: bytes, data: bytes) -> str:
+        """Queue an object for writing and return its SHA straight away."""
+        sha, raw = self.hash_object(obj_type, data)
+        if obj_type != b'blob':
+            self.recent[sha] = (obj_type, data)
+            if len(self.recent) > 16:
+                self.recent.popitem(last=False)
+        if sha in self.written:
+            return sha
+        self.written.add(sha)
+
+        if self.pack is not None:
+            self.pack.add(sha, obj_type, data, self.pool.submit(zlib.compress, data))
         else:
-            # Start from a Sunday one year ago to align with GitHub's week start
-            one_year_ago = datetime.now() - timedelta(days=365)
-            days_since_sunday = one_year_ago.weekday() + 1
-            if days_since_sunday == 7:
-                days_since_sunday = 0
-            return one_year_ago - timedelta(days=days_since_sunday)
+            self.pending.append(self.pool.submit(self._write_loose, sha, raw))
+        return sha
 
-    def _create_pattern_grid(self) -> List[List[bool]]:
-        """Create a 2D grid representing the commit pattern."""
-        if not self.word:
-            return []
+    def _write_loose(self, sha: str, raw: bytes):
+        directory = os.path.join(self.objects_dir, sha[:2])
+        path = os.path.join(directory, sha[2:])
+        if os.path.exists(path):
+            return
+        os.makedirs(directory, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(zlib.compress(raw))
+        os.replace(tmp, path)
+
+    def read(self, sha: str) -> Tuple[bytes, bytes]:
+        """Return (type, body) of an object."""
+        if sha in self.recent:
+            return self.recent[sha]
+
+        path = os.path.join(self.objects_dir, sha[:2], sha[2:])
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                raw = zlib.decompress(f.read())
+            header, data = raw.split(b"\0", 1)
+            return header.split(b" ")[0], data
+
+        result = subprocess.run(['git', 'cat-file', '-t', sha], capture_output=True, check=True)
+        obj_type = result.stdout.strip()
+        result = subprocess.run(['git', 'cat-file', obj_type.decode(), sha],
+                                capture_output=True, check=True)
+        return obj_type, result.stdout
+
+    def start_pack(self):
+        """Send every following object to a new packfile instead of loose files."""
+        self.pack = PackWriter(os.path.join(self.objects_dir, 'pack'))
+
+    def flush(self):
+        """Wait for queued writes and finalize the packfile, if any."""
+        for future in self.pending:
+            future.result()
+        self.pending = []
+        if self.pack is not None:
+            pack, self.pack = self.pack, None
+            try:
+                pack.finish()
+            except BaseException:
+                pack.abort()
+                raise
+
+    def close(self):
+        self.flush()
+        self.pool.shutdown()
+
+    # -- trees --------------------------------------------------------------
+
+    def read_tree(self, sha: str) -> List[Tuple[bytes, bytes, bytes]]:
+        """Parse a tree into (mode, name, binary SHA) entries."""
+        _, data = self.read(sha)
+        entries = []
+        pos = 0
+        while pos < len(data):
+            space = data.index(b" ", pos)
+            nul = data.index(b"\0", space)
+            entries.append((data[pos:space], data[space + 1:nul], data[nul + 1:nul + 21]))
+            pos = nul + 21
+        return entries
 
-        # Get patterns for each letter
-        letter_patterns = []
-        for char in self.word:
-            if char in LETTER_PATTERNS:
-                letter_patterns.append(LETTER_PATTERNS[char])
+    @staticmethod
+    def format_tree(entries: List[Tuple[bytes, bytes, bytes]]) -> bytes:
+        """Serialize tree entries in git's canonical order."""
+        entries = sorted(entries, key=lambda e: e[1] + b"/" if e[0] == b"40000" else e[1])
+        return b"".join(b"%s %s\0%s" % entry for entry in entries)
+
+    def commit_tree(self, sha: str) -> str:
+        """Return the tree SHA of a commit."""
+        _, data = self.read(sha)
+        return data[5:45].decode()
+
+    # -- refs ---------------------------------------------------------------
+
+    def read_ref(self, ref: str) -> str:
+        """Resolve a ref (or HEAD) to a SHA, or None if it does not exist."""
+        base = self.git_dir if ref == 'HEAD' else self.common_dir
+        path = os.path.join(base, ref)
+        if os.path.isfile(path):
+            with open(path) as f:
+                value = f.read().strip()
+            if value.startswith('ref: '):
+                return self.read_ref(value[5:])
+            return value or None
+
+        packed = os.path.join(self.common_dir, 'packed-refs')
+        if os.path.isfile(packed):
+            with open(packed) as f:
+                for line in f:
+                    if line[0] in '#^':
+                        continue
+                    sha, name = line.split()
+                    if name == ref:
+                        return sha
+        return None
+
+    def update_refs(self, updates: List[Tuple[str, str, str]], ident: str, message: str):
+        """Move every (ref, new, old or None) under lock files, all or nothing.
+
+        All refs are locked and checked against their old value before any
+        of them is renamed into place.
+        """
+        locks = []
+        try:
+            for ref, new, old in updates:
+                path = os.path.join(self.common_dir, ref)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                fd = os.open(path + '.lock', os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+                locks.append(path + '.lock')
+                with os.fdopen(fd, 'w') as f:
+                    f.write(new + "\n")
+                if self.read_ref(ref) != old:
+                    raise RuntimeError(f"{ref} changed while drawing; not updating it")
+        except BaseException:
+            for lock in locks:
+                os.remove(lock)
+            raise
+
+        now = datetime.now().astimezone()
+        for ref, new, old in updates:
+            path = os.path.join(self.common_dir, ref)
+            os.replace(path + '.lock', path)
+
+            log = os.path.join(self.common_dir, 'logs', ref)
+            os.makedirs(os.path.dirname(log), exist_ok=True)
+            with open(log, 'a') as f:
+                f.write(f"{old or '0' * 40} {new} {ident} {int(now.timestamp())} "
+                        f"{now.strftime('%z')}\t{message}\n")
+
+
+class PackWriter:
+    """Stream objects into a version 2 packfile and write its index."""
+
+    def __init__(self, pack_dir: str):
+        os.makedirs(pack_dir, exist_ok=True)
+        self.pack_dir = pack_dir
+        self.tmp_path = os.path.join(pack_dir, f"tmp_pack_{os.getpid()}_{threading.get_ident()}")
+        self.file = open(self.tmp_path, 'w+b')
+        # Object count is patched in by finish()
+        self.file.write(b"PACK" + struct.pack('>II', 2, 0))
+        self.entries = []
+        self.queue = []
+
+    def add(self, sha: str, obj_type: bytes, data: bytes, compressed):
+        """Append an object whose compressed body may still be in flight."""
+        self.queue.append((sha, obj_type, len(data), compressed))
+        # Keep a bounded window of compression jobs so memory stays flat
+        if len(self.queue) >= 256:
+            self._drain(len(self.queue) // 2)
+
+    def _drain(self, count: int = None):
+        count = len(self.queue) if count is None else count
+        for _ in range(count):
+            sha, obj_type, size, compressed = self.queue[0]
+            header = bytearray()
+            byte = (PACK_TYPES[obj_type] << 4) | (size & 0x0f)
+            size >>= 4
+            while size:
+                header.append(byte | 0x80)
+                byte = size & 0x7f
+                size >>= 7
+            header.append(byte)
+            body = bytes(header) + compressed.result()
+            # An interrupt between objects must leave the pack consistent for finish()
+            offset = self.file.tell()
+            self.file.write(body)
+            self.entries.append((bytes.fromhex(sha), zlib.crc32(body), offset))
+            del self.queue[0]
+
+    def abort(self):
+        """Drop the unfinished pack and its temporary files."""
+        for _, _, _, compressed in self.queue:
+            compressed.cancel()
+        self.queue = []
+        self.file.close()
+        for path in (self.tmp_path, self.tmp_path + '.idx'):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def finish(self):
+        """Close the pack, write pack-<sha>.pack/.idx and make them visible."""
+        self._drain()
+        if not self.entries:
+            # Nothing went in since the last checkpoint
+            self.abort()
+            return
+        self.file.seek(8)
+        self.file.write(struct.pack('>I', len(self.entries)))
+        self.file.seek(0)
+        digest = hashlib.sha1()
+        for chunk in iter(lambda: self.file.read(1 << 20), b""):
+            digest.update(chunk)
+        pack_sha = digest.digest()
+        self.file.write(pack_sha)
+        self.file.close()
+
+        self.entries.sort()
+        fanout = [0] * 256
+        for sha, _, _ in self.entries:
+            fanout[sha[0]] += 1
+        large = []
+        offsets = []
+        for _, _, offset in self.entries:
+            if offset < 0x80000000:
+                offsets.append(offset)
+            else:
+                offsets.append(0x80000000 | len(large))
+                large.append(offset)
+
+        total = 0
+        index = bytearray(b"\xfftOc" + struct.pack('>I', 2))
+        for count in fanout:
+            total += count
+            index += struct.pack('>I', total)
+        index += b"".join(sha for sha, _, _ in self.entries)
+        index += b"".join(struct.pack('>I', crc) for _, crc, _ in self.entries)
+        index += b"".join(struct.pack('>I', offset) for offset in offsets)
+        index += b"".join(struct.pack('>Q', offset) for offset in large)
+        index += pack_sha
+        index += hashlib.sha1(index).digest()
+
+        name = os.path.join(self.pack_dir, f"pack-{pack_sha.hex()}")
+        with open(self.tmp_path + '.idx', 'wb') as f:
+            f.write(index)
+        os.replace(self.tmp_path, name + '.pack')
+        os.replace(self.tmp_path + '.idx', name + '.idx')
+
+
+class DayHistogram:
+    """Per-day commit counts of one author (or everyone), cached on disk.
+
+    The counts are a flat array of days from an origin date on. Several of
+    them are kept in .git/word-drawer/, each with the commit it was counted
+    up to, most recently used first: HEAD and the branches drawn on each
+    keep their own. When a kept commit is an ancestor of the one asked
+    for, only the commits in between are read; otherwise the window is
+    counted again.
+    """
+
+    MAGIC = b'WDH2'
+    MAX_ENTRIES = 8
+
+    def __init__(self, author: str = None):
+        key = hashlib.sha1((author or '').encode()).hexdigest()[:16]
+        self.path = os.path.join(_common_dir(), 'word-drawer', f"days-{key}.bin")
+        self.author = author
+        # [tip, origin (proleptic ordinal of counts[0]), counts]
+        self.entries = []
+        self.tip = None
+        self.origin = 0
+        self.counts = array('I')
+        if os.path.isfile(self.path):
+            with open(self.path, 'rb') as f:
+                data = f.read()
+            if data[:4] == self.MAGIC:
+                pos = 4
+                while pos < len(data):
+                    tip_len, = struct.unpack_from('>B', data, pos)
+                    tip = data[pos + 1:pos + 1 + tip_len].decode()
+                    origin, length = struct.unpack_from('>II', data, pos + 1 + tip_len)
+                    pos += 9 + tip_len
+                    counts = array('I')
+                    counts.frombytes(data[pos:pos + length * counts.itemsize])
+                    pos += length * counts.itemsize
+                    self.entries.append([tip, origin, counts])
+
+    def update(self, rev: str, since: datetime) -> 'DayHistogram':
+        """Bring the counts up to the commits reachable from rev, covering since onwards."""
+        tip = _rev_parse(rev)
+        origin = since.toordinal()
+        if tip is None:
+            # Unborn branch: nothing to count
+            self.tip, self.origin, self.counts = None, origin, array('I')
+            return self
+
+        usable = [entry for entry in self.entries if entry[1] <= origin]
+        entry = next((entry for entry in usable if entry[0] == tip), None)
+        if entry is None:
+            base = next((entry for entry in usable if subprocess.run(
+                ['git', 'merge-base', '--is-ancestor', entry[0], tip], capture_output=True).returncode == 0), None)
+            if base is not None:
+                entry = [tip, base[1], array('I', base[2])]
+                log_args = [f"{base[0]}..{tip}"]
             else:
-                letter_patterns.append(LETTER_PATTERNS[' '])  # Default to space
+                entry = [tip, origin, array('I')]
+                # No --since: it drops every ancestor of an older commit, and drawn histories are backdated
+                log_args = [tip]
+
+            counts = entry[2]
+            for day in _iter_commit_days(log_args, self.author):
+                index = date.fromisoformat(day).toordinal() - entry[1]
+                if index < 0:
+                    continue
+                if index >= len(counts):
+                    counts.extend([0] * (index + 1 - len(counts)))
+                counts[index] += 1
+
+        self.entries = [entry] + [other for other in self.entries if other[0] != tip][:self.MAX_ENTRIES - 1]
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(self.MAGIC)
+            for entry_tip, entry_origin, counts in self.entries:
+                f.write(struct.pack('>B', len(entry_tip)) + entry_tip.encode()
+                        + struct.pack('>II', entry_origin, len(counts)) + counts.tobytes())
+        os.replace(tmp, self.path)
+
+        self.tip, self.origin, self.counts = entry
+        return self
+
+    def days(self, since: datetime) -> Dict[str, int]:
+        """Map each day from since on that has commits to its count."""
+        first = since.toordinal()
+        return {date.fromordinal(self.origin + index).isoformat(): count
+                for index, count in enumerate(self.counts)
+                if count and self.origin + index >= first}
+
+
+def _rev_parse(rev: str) -> str:
+    """Resolve a revision to a commit SHA, or return None if it does not exist."""
+    result = subprocess.run(['git', 'rev-parse', '--verify', '--quiet', f"{rev}^{{commit}}"],
+                            capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _iter_commit_days(log_args: List[str], author: str = None) -> Iterator[str]:
+    """Stream the author day (YYYY-MM-DD) of every commit `git log <log_args>` lists.
+
+    With author, only commits whose author email matches exactly are listed.
+    """
+    proc = subprocess.Popen(['git', 'log', '--format=%ad %ae', '--date=short'] + log_args,
+                            stdout=subprocess.PIPE, text=True)
+    for line in proc.stdout:
+        day, _, email = line.rstrip('\n').partition(' ')
+        if author is None or email == author:
+            yield day
+    if proc.wait():
+        raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+
+def _commits_per_day(rev: str, since: datetime, author: str = None) -> Dict[str, int]:
+    """Count the commits reachable from rev per author day (YYYY-MM-DD), from since on."""
+    return DayHistogram(author).update(rev, since).days(since)
+
+
+def _rev_parse_tree(rev: str) -> str:
+    """Resolve a commit to its tree SHA."""
+    result = subprocess.run(['git', 'rev-parse', '--verify', f"{rev}^{{tree}}"],
+                            capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def _pack_report(new_tip: str, start: str) -> Tuple[int, int]:
+    """Count the objects new_tip adds on top of start, and the size of the pack carrying them."""
+    revs = f"{new_tip}\n" + (f"^{start}\n" if start else "")
+    result = subprocess.run(['git', 'rev-list', '--objects', '--stdin'],
+                            input=revs, capture_output=True, text=True, check=True)
+    objects = result.stdout.count("\n")
+    result = subprocess.run(['git', 'pack-objects', '--stdout', '--revs', '-q'],
+                            input=revs.encode(), capture_output=True, check=True)
+    return objects, len(result.stdout)
+
+
+def _git_ident(var: str) -> str:
+    """Return 'Name <email>' for GIT_AUTHOR_IDENT or GIT_COMMITTER_IDENT."""
+    result = subprocess.run(['git', 'var', var], capture_output=True, text=True, check=True)
+    # Strip the trailing "<timestamp> <tz>"
+    return result.stdout.strip().rsplit(' ', 2)[0]
+
+
+def _author_email() -> str:
+    """Email of the identity new commits are authored with."""
+    return _git_ident('GIT_AUTHOR_IDENT').rsplit('<', 1)[1].rstrip('>')
+
+
+def _git_date(commit_datetime: datetime) -> str:
+    """Format a naive local datetime in git's raw "<timestamp> <tz>" form."""
+    local = commit_datetime.astimezone()
+    return f"{int(local.timestamp())} {local.strftime('%z')}"
+
+
+def _sync_checked_out_branch(branch_name: str, old_tip: str, new_tip: str):
+    """Bring index and worktree up to date if the redrawn branch is checked out."""
+    result = subprocess.run(['git', 'symbolic-ref', '--quiet', 'HEAD'],
+                            capture_output=True, text=True)
+    if result.stdout.strip() != f"refs/heads/{branch_name}":
+        return
 
-        # Calculate total width
-        total_width = sum(len(pattern[0]) for pattern in letter_patterns) + len(letter_patterns) - 1
+    if old_tip:
+        subprocess.run(['git', 'read-tree', '-m', '-u', old_tip, new_tip], check=True)
+    else:
+        subprocess.run(['git', 'read-tree', '-m', '-u', new_tip], check=True)
 
-        # Create the grid (7 rows for days of week)
-        grid = [[False for _ in range(total_width)] for _ in range(7)]
 
-        # Fill the grid
-        col_offset = 0
-        for pattern in letter_patterns:
-            pattern_width = len(pattern[0])
+def _objects_size() -> int:
+    """Total bytes of the repository's object database."""
+    total = 0
+    for directory, _, files in os.walk(os.path.join(_common_dir(), 'objects')):
+        total += sum(os.path.getsize(os.path.join(directory, name)) for name in files)
+    return total
 
-            for row in range(7):
-                for col in range(pattern_width):
-                    if pattern[row][col] == '█':
-                        grid[row][col_offset + col] = True
 
-            col_offset += pattern_width + 1  # Add spacing between letters
+@functools.lru_cache(maxsize=None)
+def probe_git() -> Dict[str, object]:
+    """Probe the installed git and the current repository once per process."""
+    result = subprocess.run(['git', 'version'], capture_output=True, text=True, check=True)
+    version = tuple(int(part) for part in re.findall(r'\d+', result.stdout)[:3])
 
-        return grid
+    result = subprocess.run(['git', 'rev-parse', '--show-object-format'],
+                            capture_output=True, text=True)
+    # Before git 2.28 the option is echoed back and only SHA-1 exists
+    object_format = result.stdout.strip() if result.returncode == 0 else 'sha1'
+    if object_format.startswith('--'):
+        object_format = 'sha1'
 
-    def _get_commit_dates(self, grid: List[List[bool]]) -> List[datetime]:
-        """Convert grid pattern to commit dates."""
-        commit_dates = []
+    result = subprocess.run(['git', 'config', '--get', 'extensions.refStorage'],
+                            capture_output=True, text=True)
+    ref_format = result.stdout.strip().lower() or 'files'
 
-        if not grid or not grid[0]:
-            return commit_dates
+    return {'version': version, 'object_format': object_format, 'ref_format': ref_format}
 
-        num_weeks = len(grid[0])
 
-        for week in range(num_weeks):
-            for day in range(7):  # 0=Sunday, 1=Monday, ..., 6=Saturday
-                if grid[day][week]:
-                    commit_date = self.start_date + timedelta(weeks=week, days=day)
-                    commit_dates.append(commit_date)
+# Git settings relaxed for every git process started during a bulk session
+BULK_CONFIG = {
+    'core.hooksPath': os.devnull,  # no hooks can be found there
+    'gc.auto': '0',
+    'maintenance.auto': 'false',
+}
 
-        return sorted(commit_dates)
 
-    def create_branch(self, branch_name: str = None) -> str:
-        """Create a new git branch."""
-        if not branch_name:
-            branch_name = f"word-{self.word.lower().replace(' ', '-')}"
+def _raise_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+@contextlib.contextmanager
+def sigterm_as_interrupt():
+    """Turn SIGTERM into KeyboardInterrupt so cleanup and checkpoints run when killed."""
+    previous = signal.signal(signal.SIGTERM, _raise_interrupt)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+
+
+@contextlib.contextmanager
+def bulk_session():
+    """Relax git for the duration of a drawing and restore everything afterwards.
+
+    Hooks are bypassed, automatic gc/maintenance is off and fsync is relaxed.
+    With git 2.31+ the settings only live in GIT_CONFIG_* environment
+    variables inherited by child processes; older versions get them written
+    to the repository config. Either way they are put back in a finally
+    block, so an interrupted run restores them too, and a single sync at the
+    end makes the written objects durable.
+    """
+    version = probe_git()['version']
+    settings = dict(BULK_CONFIG)
+    if version >= (2, 36):
+        settings['core.fsync'] = 'none'
+    else:
+        settings['core.fsyncObjectFiles'] = 'false'
+
+    saved_env = {}
+    saved_config = {}
+    try:
+        if version >= (2, 31):
+            count = int(os.environ.get('GIT_CONFIG_COUNT', 0))
+            saved_env['GIT_CONFIG_COUNT'] = os.environ.get('GIT_CONFIG_COUNT')
+            for index, (key, value) in enumerate(settings.items(), start=count):
+                for name, setting in ((f'GIT_CONFIG_KEY_{index}', key), (f'GIT_CONFIG_VALUE_{index}', value)):
+                    saved_env[name] = os.environ.get(name)
+                    os.environ[name] = setting
+            os.environ['GIT_CONFIG_COUNT'] = str(count + len(settings))
+        else:
+            for key, value in settings.items():
+                result = subprocess.run(['git', 'config', '--local', '--get', key],
+                                        capture_output=True, text=True)
+                saved_config[key] = result.stdout.strip() if result.returncode == 0 else None
+                subprocess.run(['git', 'config', '--local', key, value], check=True)
+        yield
+    finally:
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        for key, value in saved_config.items():
+            if value is None:
+                subprocess.run(['git', 'config', '--local', '--unset', key])
+            else:
+                subprocess.run(['git', 'config', '--local', key, value])
+        if hasattr(os, 'sync'):
+            os.sync()
+
+
+def _time_git_log(branches: List[str]) -> float:
+    """Seconds `git log` takes to walk the given branches."""
+    started = time.perf_counter()
+    subprocess.run(['git', 'log', '--format=%H %ad'] + [f"refs/heads/{branch}" for branch in branches],
+                   stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - started
+
+
+def maintain_repository(branches: List[str]):
+    """Pack loose objects and write the commit-graph and multi-pack-index.
+
+    `git log` on the drawn branches is timed before and after, so the gain
+    is visible.
+    """
+    version = probe_git()['version']
+    before = _time_git_log(branches)
+
+    print("Repacking loose objects...")
+    subprocess.run(['git', 'repack', '-d', '-q'], check=True)
+    if version >= (2, 18):
+        print("Writing commit-graph...")
+        subprocess.run(['git', 'commit-graph', 'write', '--reachable'], check=True)
+    if version >= (2, 21):
+        print("Writing multi-pack-index...")
+        subprocess.run(['git', 'multi-pack-index', 'write'], check=True)
+
+    after = _time_git_log(branches)
+    print(f"git log on {', '.join(branches)}: {before * 1000:.1f} ms before, {after * 1000:.1f} ms after")
+
+
+class CommitBackend:
+    """Writes a drawing's commits into the repository."""
+
+    name = None
+
+    def available(self, git: Dict[str, object]) -> bool:
+        """Whether this engine can run with the probed git and repository."""
+        return True
+
+    def create_branch(self, drawer: 'GitHubWordDrawer', branch_name: str = None) -> str:
+        """Prepare the branch to draw on and return its name."""
+        raise NotImplementedError
+
+    def create_commits(self, drawer: 'GitHubWordDrawer', commit_dates: Iterable[datetime],
+                       branch_name: str):
+        """Write one commit per entry of drawer's commit plan onto the branch."""
+        raise NotImplementedError
+
+    def checkpoint(self) -> bool:
+        """Make every object written so far durable, or return False if that is not possible yet."""
+        return True
+
+    def move_branch(self, drawer, branch_name, old_tip, new_tip):
+        """Point the branch at an existing commit that descends from old_tip."""
+        # create_branch checked the branch out
+        subprocess.run(['git', 'reset', '-q', '--keep', new_tip], check=True)
+
+
+class SubprocessBackend(CommitBackend):
+    """Checks the branch out and runs `git add` + `git commit` for every commit."""
+
+    name = 'subprocess'
+
+    def create_branch(self, drawer, branch_name=None):
+        branch_name = drawer._branch_name(branch_name)
+
+        if drawer.base or drawer.orphan:
+            print("Error: --base and --orphan need a backend that does not check the branch out")
+            sys.exit(1)
 
         try:
-            # Check if branch exists
-            result = subprocess.run(['git', 'branch', '--list', branch_name],
-                                  capture_output=True, text=True)
-            if branch_name in result.stdout:
+            # Check if branch exists (exact ref, not a pattern match)
+            if _rev_parse(f"refs/heads/{branch_name}"):
                 print(f"Branch '{branch_name}' already exists. Switching to it.")
                 subprocess.run(['git', 'checkout', branch_name], check=True)
             else:
@@ -349,50 +1389,776 @@ class GitHubWordDrawer:
             print(f"Error creating branch: {e}")
             sys.exit(1)
 
-    def create_commits(self, commit_dates: List[datetime]):
-        """Create commits for each date in the pattern."""
-        if not commit_dates:
-            print("No commit dates generated. Check your word pattern.")
+    def create_commits(self, drawer, commit_dates, branch_name):
+        for commit_datetime, commit_message, content in drawer._commit_plan(commit_dates):
+            if content is not None:
+                # Create/update file content
+                with open(COMMIT_FILE, 'w') as f:
+                    f.write(content)
+
+                # Stage the file
+                subprocess.run(['git', 'add', COMMIT_FILE], check=True)
+
+            date_str = commit_datetime.strftime('%Y-%m-%d %H:%M:%S')
+
+            env = dict(os.environ, GIT_AUTHOR_DATE=date_str, GIT_COMMITTER_DATE=date_str)
+
+            subprocess.run(['git', 'commit', '--allow-empty', '-m', commit_message],
+                          env=env, check=True)
+            drawer._commit_written()
+
+
+class ChainBackend(CommitBackend):
+    """Builds the commit chain off to the side and moves the branch ref once.
+
+    The branch is never checked out. The chain continues the branch, or
+    starts from HEAD like `git checkout -b` would, unless the drawer names a
+    base commit or asks for an orphan history. An interrupted run leaves the
+    branch as it was.
+    Between open() and close() several chains can be built while sharing
+    processes and already written objects, as batch runs do.
+    """
+
+    def create_branch(self, drawer, branch_name=None):
+        return drawer._branch_name(branch_name)
+
+    def create_commits(self, drawer, commit_dates, branch_name):
+        old_tip = _rev_parse(f"refs/heads/{branch_name}")
+        self.open()
+        try:
+            new_tip = self.build_chain(drawer, commit_dates, drawer._resolve_parent(old_tip))
+        finally:
+            self.close()
+        self.move_branch(drawer, branch_name, old_tip, new_tip)
+
+    def move_branch(self, drawer, branch_name, old_tip, new_tip):
+        self.update_refs(f"word drawer: draw '{drawer.word}'", [(branch_name, new_tip, old_tip)])
+        _sync_checked_out_branch(branch_name, old_tip, new_tip)
+
+    def open(self):
+        """Start a session shared by every build_chain call until close()."""
+
+    def close(self):
+        """End the session; every object written so far is then readable."""
+
+    def build_chain(self, drawer: 'GitHubWordDrawer', commit_dates: Iterable[datetime],
+                    parent: str) -> str:
+        """Write the commits on top of parent (None: root commit) and return the tip."""
+        raise NotImplementedError
+
+    def update_refs(self, message: str, updates: List[Tuple[str, str, str]]):
+        """Move every (branch, new tip, old tip or None) in one all-or-nothing transaction."""
+        lines = "".join(f"update refs/heads/{branch} {new} {old or '0' * 40}\n"
+                        for branch, new, old in updates)
+        subprocess.run(['git', 'update-ref', '-m', message, '--stdin'],
+                       input=lines, text=True, check=True)
+
+
+class FastImportBackend(ChainBackend):
+    """Streams commit chains into a single `git fast-import` process."""
+
+    name = 'fast-import'
+
+    # Scratch ref the stream commits to; it is reset to null before the end
+    SCRATCH_REF = 'refs/word-drawer/fast-import'
+
+    def __init__(self):
+        self.proc = None
+        self.mark = 0
+        # Tips built in this session only exist inside fast-import; refer to them by mark
+        self.tip_marks = {}
+
+    def available(self, git):
+        # get-mark needs git 2.6
+        return git['version'] >= (2, 6)
+
+    def checkpoint(self):
+        # Objects only land in the repository when the stream ends
+        return False
+
+    def open(self):
+        self.proc = subprocess.Popen(['git', 'fast-import', '--quiet', '--done'],
+                                     stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def close(self):
+        # Drop the scratch ref so fast-import writes no refs at all
+        try:
+            self.proc.stdin.write(b"reset %s\nfrom %s\n\ndone\n" % (self.SCRATCH_REF.encode(), b"0" * 40))
+            self.proc.stdin.close()
+        except BrokenPipeError:
+            pass  # fast-import already died; report its exit status below
+        if self.proc.wait() != 0:
+            raise subprocess.CalledProcessError(self.proc.returncode, 'git fast-import')
+        self.proc = None
+        self.tip_marks = {}
+
+    def build_chain(self, drawer, commit_dates, parent):
+        author = _git_ident('GIT_AUTHOR_IDENT').encode()
+        committer = _git_ident('GIT_COMMITTER_IDENT').encode()
+        path = COMMIT_FILE.encode()
+        ref = self.SCRATCH_REF.encode()
+
+        out = self.proc.stdin
+        # Start from an empty scratch branch so a previous chain is not the parent
+        out.write(b"reset %s\n\n" % ref)
+        first = True
+        for commit_datetime, commit_message, content in drawer._commit_plan(commit_dates):
+            self.mark += 1
+            date = _git_date(commit_datetime).encode()
+            message = commit_message.encode() + b"\n"
+
+            out.write(b"commit %s\nmark :%d\n" % (ref, self.mark))
+            out.write(b"author %s %s\ncommitter %s %s\n" % (author, date, committer, date))
+            out.write(b"data %d\n%s" % (len(message), message))
+            if first and parent:
+                if parent in self.tip_marks:
+                    out.write(b"from :%d\n" % self.tip_marks[parent])
+                else:
+                    out.write(b"from %s\n" % parent.encode())
+            if content is not None:
+                data = content.encode()
+                out.write(b"M 100644 inline %s\ndata %d\n%s\n" % (path, len(data), data))
+            out.write(b"\n")
+            first = False
+
+        if first:
+            return parent
+        out.write(b"get-mark :%d\n" % self.mark)
+        out.flush()
+        tip = self.proc.stdout.readline().decode().strip()
+        self.tip_marks[tip] = self.mark
+        return tip
+
+
+class PlumbingBackend(ChainBackend):
+    """Builds each commit with hash-object, mktree and commit-tree.
+
+    Parent SHAs are threaded in memory and nothing touches the index, the
+    worktree or word_pattern.txt on disk.
+    """
+
+    name = 'plumbing'
+
+    def __init__(self):
+        self.mktree = None
+        self.blobs = {}
+
+    def open(self):
+        self.mktree = subprocess.Popen(['git', 'mktree', '-z', '--batch'],
+                                       stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def close(self):
+        self.mktree.stdin.close()
+        self.mktree.wait()
+        self.mktree = None
+
+    def build_chain(self, drawer, commit_dates, parent):
+        # Entries of the parent tree, minus the file we are about to replace
+        base_entries = b""
+        if parent:
+            result = subprocess.run(['git', 'ls-tree', '-z', parent],
+                                    capture_output=True, check=True)
+            for entry in result.stdout.split(b"\0"):
+                if entry and entry.split(b"\t", 1)[1] != COMMIT_FILE.encode():
+                    base_entries += entry + b"\0"
+            tree = _rev_parse_tree(parent)
+        else:
+            tree = subprocess.run(['git', 'mktree'], input='', capture_output=True,
+                                  text=True, check=True).stdout.strip()
+
+        for commit_datetime, commit_message, content in drawer._commit_plan(commit_dates):
+            # Empty commits keep the previous tree
+            if content is not None:
+                blob = self.blobs.get(content)
+                if blob is None:
+                    result = subprocess.run(['git', 'hash-object', '-w', '--stdin'],
+                                            input=content, capture_output=True, text=True, check=True)
+                    blob = result.stdout.strip()
+                    # Only constant content repeats; caching growing logs would hold every version
+                    if drawer.content == 'constant':
+                        self.blobs[content] = blob
+
+                self.mktree.stdin.write(base_entries)
+                self.mktree.stdin.write(b"100644 blob %s\t%s\0\0" % (blob.encode(), COMMIT_FILE.encode()))
+                self.mktree.stdin.flush()
+                tree = self.mktree.stdout.readline().decode().strip()
+
+            date_str = commit_datetime.strftime('%Y-%m-%d %H:%M:%S')
+            env = dict(os.environ, GIT_AUTHOR_DATE=date_str, GIT_COMMITTER_DATE=date_str)
+            cmd = ['git', 'commit-tree', tree, '-m', commit_message]
+            if parent:
+                cmd += ['-p', parent]
+            result = subprocess.run(cmd, env=env, capture_output=True, text=True, check=True)
+            parent = result.stdout.strip()
+            drawer._commit_written(parent)
+
+        return parent
+
+
+class ObjectsBackend(ChainBackend):
+    """Writes blobs, trees and commits straight into .git/objects from Python.
+
+    No git process is spawned per commit. Once a chain exceeds PACK_THRESHOLD
+    commits the rest of the session goes into packfiles, a new one after
+    every checkpoint, and branch ref files are updated in place.
+    """
+
+    name = 'objects'
+
+    def __init__(self):
+        self.store = None
+
+    def available(self, git):
+        return git['object_format'] == 'sha1' and git['ref_format'] == 'files'
+
+    def open(self):
+        self.store = ObjectStore()
+
+    def close(self):
+        self.store.close()
+        self.store = None
+
+    def build_chain(self, drawer, commit_dates, parent):
+        store = self.store
+
+        base_entries = []
+        if parent:
+            tree = store.commit_tree(parent)
+            base_entries = [entry for entry in store.read_tree(tree)
+                            if entry[1] != COMMIT_FILE.encode()]
+        else:
+            tree = store.write(b'tree', b"")
+
+        author = _git_ident('GIT_AUTHOR_IDENT')
+        committer = _git_ident('GIT_COMMITTER_IDENT')
+
+        if store.pack is None and drawer._count_commits(commit_dates) > PACK_THRESHOLD:
+            store.start_pack()
+
+        for commit_datetime, commit_message, content in drawer._commit_plan(commit_dates):
+            # Empty commits keep the previous tree
+            if content is not None:
+                blob = store.write(b'blob', content.encode())
+                tree = store.write(b'tree', store.format_tree(
+                    base_entries + [(b'100644', COMMIT_FILE.encode(), bytes.fromhex(blob))]))
+
+            date = _git_date(commit_datetime)
+            body = f"tree {tree}\n"
+            if parent:
+                body += f"parent {parent}\n"
+            body += f"author {author} {date}\ncommitter {committer} {date}\n\n{commit_message}\n"
+            parent = store.write(b'commit', body.encode())
+            drawer._commit_written(parent)
+
+        return parent
+
+    def checkpoint(self):
+        store = self.store
+        if store is None:
+            # close() has flushed everything, finishing the pack even when interrupted
+            return True
+        packing = store.pack is not None
+        store.flush()
+        if packing:
+            # Objects are only visible in a finished pack; carry on in a new one
+            store.start_pack()
+        return True
+
+    def update_refs(self, message, updates):
+        ObjectStore().update_refs([(f"refs/heads/{branch}", new, old) for branch, new, old in updates],
+                                  _git_ident('GIT_COMMITTER_IDENT'), message)
+
+
+# Commit engines, fastest first; 'auto' picks the first one available
+BACKEND_CLASSES = [ObjectsBackend, FastImportBackend, PlumbingBackend, SubprocessBackend]
+
+BACKENDS = ['auto'] + [cls.name for cls in BACKEND_CLASSES]
+
+
+def select_backend(name: str = 'auto') -> CommitBackend:
+    """Return the named commit backend, or the fastest available one for 'auto'."""
+    if name == 'auto':
+        git = probe_git()
+        for cls in BACKEND_CLASSES:
+            backend = cls()
+            if backend.available(git):
+                return backend
+
+    for cls in BACKEND_CLASSES:
+        if cls.name == name:
+            return cls()
+    raise ValueError(f"Unknown backend '{name}' (expected one of: {', '.join(BACKENDS)})")
+
+
+def load_manifest(path: str) -> List[Dict[str, str]]:
+    """Read batch entries from a JSONL or CSV manifest.
+
+    Each entry has a word and optionally start_date, commits_per_date and
+    branch; CSV files name those columns in a header row.
+    """
+    with open(path, newline='') as f:
+        if path.endswith(('.jsonl', '.json')):
+            entries = [json.loads(line) for line in f if line.strip()]
+        else:
+            entries = list(csv.DictReader(f))
+
+    for number, entry in enumerate(entries, start=1):
+        word = entry.get('word')
+        if not word:
+            raise ValueError(f"{path}: entry {number} has no word")
+        if not all(c.isalpha() or c.isspace() for c in word):
+            raise ValueError(f"{path}: entry {number}: word can only contain letters and spaces")
+    return entries
+
+
+def _build_branch_chain(backend_name: str, parent: str, entries: List[Dict[str, object]]) -> str:
+    """Process pool worker: build one branch's chains from GitHubWordDrawer keyword arguments."""
+    backend = select_backend(backend_name)
+    backend.open()
+    try:
+        for entry in entries:
+            drawer = GitHubWordDrawer(backend=backend, **entry)
+            parent = backend.build_chain(drawer, drawer._iter_commit_dates(), parent)
+    finally:
+        backend.close()
+    return parent
+
+
+class GitHubWordDrawer:
+    def __init__(self, word: str, start_date: str = None, commits_per_date: int = 5,
+                 backend=None, font: BitmapFont = None, base: str = None, orphan: bool = False,
+                 content: str = 'counter', report: bool = False, bulk: bool = False,
+                 maintain: bool = False, top_up: bool = False, pattern: bytes = None,
+                 replace: bool = False):
+        if content not in CONTENT_STRATEGIES:
+            raise ValueError(f"Unknown content strategy '{content}' "
+                             f"(expected one of: {', '.join(CONTENT_STRATEGIES)})")
+        # The builtin font only has capitals; loaded fonts look both cases up themselves
+        self.word = word if font else word.upper()
+        self.content = content
+        self.report = report
+        self.bulk = bulk
+        self.maintain = maintain
+        # Checkpoint journal of the current create_commits call (see _open_journal)
+        self._journal_path = None
+        self._journal_state = None
+        self._resume_tip = None
+        self._resume_dates = 0
+        self._journal_tip = None
+        self._journal_time = 0.0
+        self._pending_checkpoint = None
+        self._commits_written = 0
+        # Commits per day already in the history the drawing lands on, and the
+        # count every lit day is brought up to
+        self.top_up = top_up
+        self._existing = {}
+        self._target = commits_per_date
+        self._reached = False
+        # Optional per-cell levels (0-4, 7 per week) drawn instead of the word's glyphs
+        self.pattern = pattern
+        self.base = base
+        self.orphan = orphan
+        # Whether --base/--orphan may drop the history of an existing branch
+        self.replace = replace
+        self.font = font or DEFAULT_FONT
+        self.start_date = self._parse_start_date(start_date)
+        self.commits_per_date = commits_per_date
+        # A backend instance can be shared between drawers, as batch runs do
+        if isinstance(backend, CommitBackend):
+            self.backend = backend
+        else:
+            self.backend = select_backend(backend or 'auto')
+
+    def _parse_start_date(self, start_date: str) -> datetime:
+        """Parse start date, search one with start_date='auto', or use a date from one year ago."""
+        if start_date == 'auto':
+            return self._find_start_date()
+        if start_date:
+            return datetime.strptime(start_date, "%Y-%m-%d")
+        else:
+            # Start from a Sunday one year ago to align with GitHub's week start
+            one_year_ago = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=365)
+            days_since_sunday = one_year_ago.weekday() + 1
+            if days_since_sunday == 7:
+                days_since_sunday = 0
+            return one_year_ago - timedelta(days=days_since_sunday)
+
+    def _find_start_date(self) -> datetime:
+        """Pick the Sunday in the past year where the word overlaps the fewest existing commits.
+
+        Only placements whose last lit day is today or earlier are considered.
+
+        A placement covers whole weeks, which is a contiguous run of days, so
+        prefix sums over one per-day histogram of the author's commits price
+        every placement in constant time. Ties go to the earliest Sunday.
+        """
+        first = self._parse_start_date(None)
+        columns = list(self._iter_pattern_columns())
+        span = len(columns) * 7
+        # Days from the start to the last lit cell, which must not be in the future
+        last_lit = max((week * 7 + mask.bit_length() - 1 for week, mask in enumerate(columns) if mask), default=0)
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        placements = min((GRAPH_DAYS - span) // 7 + 1, ((today - first).days - last_lit) // 7 + 1)
+        if placements <= 1 or not _rev_parse('HEAD'):
+            return first
+
+        counts = _commits_per_day('HEAD', first, _author_email())
+        prefix = [0]
+        for offset in range(GRAPH_DAYS):
+            day = (first + timedelta(days=offset)).strftime('%Y-%m-%d')
+            prefix.append(prefix[-1] + counts.get(day, 0))
+
+        week = min(range(placements), key=lambda week: prefix[week * 7 + span] - prefix[week * 7])
+        start = first + timedelta(weeks=week)
+        print(f"Auto start: {start.strftime('%Y-%m-%d')} "
+              f"({prefix[week * 7 + span] - prefix[week * 7]} of your commits fall in the word's weeks)")
+        return start
+
+    def _iter_pattern_columns(self) -> Iterator[int]:
+        """Lazily yield the pattern one week column at a time, as a 7-bit day mask."""
+        if self.pattern is not None:
+            for week in range(0, len(self.pattern), 7):
+                yield sum(1 << day for day, level in enumerate(self.pattern[week:week + 7]) if level)
+            return
+        for index, char in enumerate(self.word):
+            if index:
+                yield 0  # Add spacing between letters
+            yield from self.font.glyph(char)
+
+    def _create_pattern_grid(self) -> array:
+        """Create the commit pattern as one 7-bit day mask per week column."""
+        if self.pattern is not None:
+            return array('B', self._iter_pattern_columns())
+        return array('B', compose_word(self.word, self.font))
+
+    def _iter_commit_dates(self, columns: Iterable[int] = None) -> Iterator[datetime]:
+        """Lazily convert pattern columns to commit dates.
+
+        Walking columns week by week and days in order already yields the
+        dates chronologically, so nothing has to be collected or sorted.
+        """
+        if columns is None:
+            columns = self._iter_pattern_columns()
+
+        for week, mask in enumerate(columns):
+            for day in range(7):  # 0=Sunday, 1=Monday, ..., 6=Saturday
+                if mask >> day & 1:
+                    yield self.start_date + timedelta(weeks=week, days=day)
+
+    def _get_commit_dates(self, grid: array) -> List[datetime]:
+        """Convert grid pattern to commit dates."""
+        return list(self._iter_commit_dates(grid))
+
+    def _count_commit_dates(self) -> int:
+        """Count the pattern's commit dates in one streaming pass."""
+        if self.pattern is not None:
+            return sum(1 for level in self.pattern if level)
+        return sum(self.font.weight(char) for char in self.word)
+
+    def _iter_cell_levels(self) -> Iterator[int]:
+        """Yield the level (1-4) of every commit date, in the order of _iter_commit_dates."""
+        if self.pattern is not None:
+            return (level for level in self.pattern if level)
+        return itertools.repeat(4, self._count_commit_dates())
+
+    def _commits_for_level(self, level: int) -> int:
+        """Commits a date of this level needs, at the drawing's target shade."""
+        return level_commits(level, self._target, self._reached)
+
+    def _count_commits(self, commit_dates: Iterable[datetime]) -> int:
+        """Total commits for commit_dates; iterators are taken to stream this pattern."""
+        try:
+            num_dates = len(commit_dates)
+        except TypeError:
+            num_dates = self._count_commit_dates()
+        if self.pattern is not None:
+            return sum(self._commits_for_level(level) for level in self.pattern)
+        return num_dates * self._commits_for_level(4)
+
+    def _branch_name(self, branch_name: str = None) -> str:
+        """Return the branch name to draw on, derived from the word by default."""
+        if not branch_name:
+            branch_name = f"word-{self.word.lower().replace(' ', '-')}"
+        return branch_name
+
+    def _resolve_parent(self, old_tip: str) -> str:
+        """Return the commit a new chain starts from (None for an orphan history).
+
+        That is the tip of an interrupted run being resumed, else the base
+        commit if one was given, else the branch's current tip, else HEAD.
+        """
+        if self._resume_tip:
+            return self._resume_tip
+        if self.orphan:
+            return None
+        if self.base:
+            parent = _rev_parse(self.base)
+            if not parent:
+                raise ValueError(f"Unknown base revision '{self.base}'")
+            return parent
+        return old_tip or _rev_parse('HEAD')
+
+    def _check_replace(self, branch_name: str, old_tip: str, parent: str):
+        """Refuse to move an existing branch onto a chain that drops its history, unless replacing."""
+        if not old_tip or self._resume_tip or parent == old_tip:
             return
+        if parent and subprocess.run(['git', 'merge-base', '--is-ancestor', old_tip, parent]).returncode == 0:
+            return
+        if not self.replace:
+            print(f"Error: '{branch_name}' at {old_tip[:12]} is not part of the new drawing's history; "
+                  f"use --replace to discard it")
+            sys.exit(1)
+        print(f"Replacing '{branch_name}': its previous tip {old_tip[:12]} will no longer be on the branch")
 
-        total_commits = len(commit_dates) * self.commits_per_date
-        print(f"Creating {total_commits} commits ({self.commits_per_date} per date)...")
+    def create_branch(self, branch_name: str = None) -> str:
+        """Create a new git branch."""
+        return self.backend.create_branch(self, branch_name)
 
-        # Create a simple file to commit
-        commit_file = "word_pattern.txt"
-        commit_counter = 0
+    def _commit_plan(self, commit_dates: Iterable[datetime]):
+        """Yield (commit datetime, message, file content) for every commit of the pattern.
 
-        for date_idx, commit_date in enumerate(commit_dates):
-            for commit_num in range(self.commits_per_date):
-                commit_counter += 1
+        The content follows the drawer's content strategy; None means an
+        empty commit that keeps its parent's tree. Dates the history already
+        has commits on only get the ones still missing.
+        """
+        total_commits = self._count_commits(commit_dates)
+        commit_counter = 0
+        log = ""
 
-                # Create/update file content
-                with open(commit_file, 'w') as f:
-                    f.write(f"Commit {commit_counter}/{total_commits} for word: {self.word}\n")
-                    f.write(f"Date: {commit_date.strftime('%Y-%m-%d')}\n")
-                    f.write(f"Commit {commit_num + 1} of {self.commits_per_date} for this date\n")
-                    f.write(f"Drawing pattern on GitHub contribution graph\n")
+        for date_idx, (commit_date, level) in enumerate(zip(commit_dates, self._iter_cell_levels())):
+            self._checkpoint(date_idx)
+            drawn = 0 if date_idx < self._resume_dates else self._existing.get(commit_date.strftime('%Y-%m-%d'), 0)
+            commits = self._commits_for_level(level)
 
-                # Stage the file
-                subprocess.run(['git', 'add', commit_file], check=True)
+            for commit_num in range(commits):
+                commit_counter += 1
 
-                # Create commit with specific date and time (spread commits throughout the day)
-                hours = (commit_num * 24) // self.commits_per_date
+                if date_idx < self._resume_dates or commit_num < drawn:
+                    # Already committed by an earlier run; only keep the counters going
+                    if self.content == 'append-log':
+                        log += f"{commit_date.strftime('%Y-%m-%d')} commit {commit_counter}/{total_commits} for word: {self.word}\n"
+                    continue
+
+                if self.content == 'empty':
+                    content = None
+                elif self.content == 'constant':
+                    content = CONSTANT_CONTENT
+                elif self.content == 'append-log':
+                    log += f"{commit_date.strftime('%Y-%m-%d')} commit {commit_counter}/{total_commits} for word: {self.word}\n"
+                    content = log
+                else:
+                    content = (
+                        f"Commit {commit_counter}/{total_commits} for word: {self.word}\n"
+                        f"Date: {commit_date.strftime('%Y-%m-%d')}\n"
+                        f"Commit {commit_num + 1} of {commits} for this date\n"
+                        f"Drawing pattern on GitHub contribution graph\n"
+                    )
+
+                # Spread commits throughout the day
+                hours = (commit_num * 24) // commits
                 minutes = (commit_num * 60) % 60
                 commit_datetime = commit_date.replace(hour=hours, minute=minutes, second=0)
 
                 commit_message = f"Draw '{self.word}' - commit {commit_counter}/{total_commits}"
-                date_str = commit_datetime.strftime('%Y-%m-%d %H:%M:%S')
 
-                env = {
-                    'GIT_AUTHOR_DATE': date_str,
-                    'GIT_COMMITTER_DATE': date_str
-                }
+                yield commit_datetime, commit_message, content
+
+    def create_commits(self, commit_dates: Iterable[datetime], branch_name: str = None):
+        """Create commits for each date in the pattern, consuming dates as they arrive."""
+        if not self._count_commits(commit_dates):
+            print("No commit dates generated. Check your word pattern.")
+            return
+
+        branch_name = self._branch_name(branch_name)
+        old_tip = _rev_parse(f"refs/heads/{branch_name}")
+        start = self._resolve_parent(old_tip) if self.report else None
+
+        self._open_journal(branch_name)
+        if self._resume_dates:
+            print(f"Resuming an interrupted run after {self._resume_dates} dates at {self._resume_tip[:12]}")
+
+        # One pass over the history the chain continues tells which cells are already drawn
+        parent = self._resolve_parent(old_tip)
+        self._check_replace(branch_name, old_tip, parent)
+        if self.top_up:
+            self._plan_top_up(parent)
+        else:
+            # The graph is per author, so other people's commits do not draw anything
+            self._existing = _commits_per_day(parent, self.start_date, _author_email()) if parent else {}
+        total_commits = self._count_commits(commit_dates)
+        missing = self._count_missing(commit_dates)
+        if not missing:
+            self._close_journal()
+            print(f"'{self.word}' is already drawn on '{branch_name}', nothing to do")
+            return
+
+        # Identical inputs give identical commits, so a drawing made before is only a ref update away
+        fingerprint = None if self._resume_tip else self._fingerprint(parent)
+        cached = fingerprint and _rev_parse(CACHE_REF_PREFIX + fingerprint)
+        if cached:
+            self.backend.move_branch(self, branch_name, old_tip, cached)
+            self._close_journal()
+            print(f"Reused the cached drawing of '{self.word}' at {cached[:12]} for '{branch_name}'")
+            if self.report:
+                self._print_report(cached, start)
+            return
+
+        print(f"Creating {missing} commits ({self._commits_for_level(4)} per date) "
+              f"with the {self.backend.name} backend..."
+              + (f" ({total_commits - missing} already drawn)" if missing < total_commits else ""))
+
+        try:
+            with sigterm_as_interrupt(), bulk_session() if self.bulk else contextlib.nullcontext():
+                self.backend.create_commits(self, commit_dates, branch_name)
+        except BaseException:
+            # The backend has ended its session, which may have made the latest commits durable
+            self._save_pending_checkpoint()
+            raise
+
+        self._close_journal()
+        new_tip = _rev_parse(f"refs/heads/{branch_name}")
+        if fingerprint:
+            subprocess.run(['git', 'update-ref', CACHE_REF_PREFIX + fingerprint, new_tip], check=True)
+        print(f"Successfully created {missing} commits for '{self.word}'")
+        if self.report:
+            self._print_report(new_tip, start)
+
+    def _fingerprint(self, parent: str) -> str:
+        """Hash every input that goes into the commits this drawing writes on top of parent."""
+        plan = {
+            'word': self.word, 'font': self.font.name, 'start': _git_date(self.start_date),
+            'commits_per_date': self.commits_per_date, 'top_up': self.top_up,
+            'content': self.content, 'parent': parent, 'pattern': self._pattern_digest(),
+            'author': _git_ident('GIT_AUTHOR_IDENT'), 'committer': _git_ident('GIT_COMMITTER_IDENT'),
+        }
+        return hashlib.sha1(json.dumps(plan, sort_keys=True).encode()).hexdigest()
+
+    def _pattern_digest(self) -> str:
+        """Short hash identifying the drawing's level pattern, if it has one."""
+        return self.pattern and hashlib.sha1(self.pattern).hexdigest()
+
+    def _plan_top_up(self, parent: str):
+        """Aim every lit day at its shade given the author's existing history.
+
+        The graph shades days relative to its busiest one, so the busiest day
+        of the drawing's year (or commits_per_date if that is higher) sets
+        the target of level 4 cells, and lower levels take their share of it.
+        Days already there get nothing.
+        """
+        counts = _commits_per_day(parent, self.start_date, _author_email()) if parent else {}
+        end = (self.start_date + timedelta(days=GRAPH_DAYS)).strftime('%Y-%m-%d')
+        self._existing = {day: count for day, count in counts.items() if day < end}
+        busiest = max(self._existing.values(), default=0)
+        self._target = max(self.commits_per_date, busiest)
+        # Level 4 only needs to pass three quarters of a busiest day that is already there
+        self._reached = busiest >= self._target
+        print(f"Topping up lit days to {self._target} commits (busiest day of the year: {busiest})")
+
+    def _count_missing(self, commit_dates: Iterable[datetime]) -> int:
+        """Commits of the plan that neither the history nor a resumed run already has."""
+        try:
+            len(commit_dates)
+        except TypeError:
+            commit_dates = self._iter_commit_dates()
+        missing = 0
+        for date_idx, (commit_date, level) in enumerate(zip(commit_dates, self._iter_cell_levels())):
+            if date_idx >= self._resume_dates:
+                drawn = self._existing.get(commit_date.strftime('%Y-%m-%d'), 0)
+                missing += max(self._commits_for_level(level) - drawn, 0)
+        return missing
+
+    def _open_journal(self, branch_name: str):
+        """Set up the checkpoint journal for this plan, resuming an interrupted run if possible.
+
+        The journal lives under .git/word-drawer/, named after a hash of the
+        plan inputs. It records the branch tip before the run, how many dates
+        are fully committed and the commit they ended on.
+        """
+        plan = {
+            'word': self.word, 'start_date': self.start_date.strftime('%Y-%m-%d'),
+            'commits_per_date': self.commits_per_date, 'top_up': self.top_up, 'branch': branch_name,
+            'content': self.content, 'base': self.base, 'orphan': self.orphan,
+            'pattern': self._pattern_digest(), 'font': self.font.name,
+        }
+        digest = hashlib.sha1(json.dumps(plan, sort_keys=True).encode()).hexdigest()[:16]
+        self._journal_path = os.path.join(_common_dir(), 'word-drawer', f"journal-{digest}.json")
+        self._journal_tip = None
+        self._journal_time = time.monotonic()
+        self._pending_checkpoint = None
+        self._commits_written = 0
+        self._resume_tip = None
+        self._resume_dates = 0
+
+        current = _rev_parse(f"refs/heads/{branch_name}")
+        state = None
+        if os.path.isfile(self._journal_path):
+            with open(self._journal_path) as f:
+                state = json.load(f)
+
+        if state and state['plan'] == plan and state['tip'] and _rev_parse(state['tip']):
+            if isinstance(self.backend, ChainBackend):
+                # The interrupted chain was never published: the branch must not have moved
+                resumable = current == state['old_tip']
+            else:
+                # Commits landed on the checked-out branch, possibly part of a date past the tip
+                resumable = current == state['tip'] or subprocess.run(
+                    ['git', 'merge-base', '--is-ancestor', state['tip'], current]).returncode == 0
+                if resumable and current != state['tip']:
+                    subprocess.run(['git', 'reset', '-q', '--keep', state['tip']], check=True)
+            if resumable:
+                self._resume_tip = state['tip']
+                self._resume_dates = state['done']
+                self._journal_state = state
+                return
+
+        self._journal_state = {'plan': plan, 'old_tip': current, 'done': 0, 'tip': None}
 
-                subprocess.run(['git', 'commit', '-m', commit_message],
-                              env=env, check=True)
+    def _commit_written(self, tip: str = None):
+        """Called by backends after each commit with its SHA (None: the new HEAD)."""
+        if self._journal_path is None:
+            return
+        self._commits_written += 1
+        self._journal_tip = tip
+
+    def _checkpoint(self, dates_done: int):
+        """Note that the first dates_done dates of the plan are committed, journaling it now and then."""
+        if self._journal_path is None or not self._commits_written:
+            return
+        self._pending_checkpoint = (dates_done, self._journal_tip)
+        if time.monotonic() - self._journal_time < CHECKPOINT_INTERVAL or not self.backend.checkpoint():
+            return
+        self._write_journal(dates_done, self._journal_tip or _rev_parse('HEAD'))
 
-        print(f"Successfully created {total_commits} commits for '{self.word}'")
+    def _save_pending_checkpoint(self):
+        """After an interrupted run, journal the last date boundary if its objects are durable by now."""
+        if self._journal_path is None or not self._pending_checkpoint:
+            return
+        dates_done, tip = self._pending_checkpoint
+        if tip and dates_done > self._journal_state['done'] and self.backend.checkpoint():
+            self._write_journal(dates_done, tip)
+
+    def _write_journal(self, dates_done: int, tip: str):
+        self._journal_state['done'] = dates_done
+        self._journal_state['tip'] = tip
+        self._journal_time = time.monotonic()
+        os.makedirs(os.path.dirname(self._journal_path), exist_ok=True)
+        tmp = self._journal_path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self._journal_state, f)
+        os.replace(tmp, self._journal_path)
+
+    def _close_journal(self):
+        """Forget the journal once the run has completed."""
+        if self._journal_path and os.path.exists(self._journal_path):
+            os.remove(self._journal_path)
+        self._journal_path = None
+        self._resume_tip = None
+        self._resume_dates = 0
+
+    def _print_report(self, new_tip: str, start: str):
+        """Print how many objects the drawing added and the size of the pack to push."""
+        objects, pack_size = _pack_report(new_tip, start)
+        print(f"Content '{self.content}': {objects} new objects, {pack_size} bytes packed")
 
     def draw_preview(self):
         """Print a preview of how the word will look."""
@@ -402,38 +2168,81 @@ class GitHubWordDrawer:
             return
 
         print(f"\nPreview of '{self.word}' pattern:")
-        print("=" * (len(grid[0]) + 2))
-
-        for row in grid:
-            line = "|"
-            for cell in row:
-                line += "█" if cell else " "
-            line += "|"
-            print(line)
-
-        print("=" * (len(grid[0]) + 2))
-        print(f"Pattern size: {len(grid)} rows × {len(grid[0])} columns")
-
-    def run(self, preview_only: bool = False):
+        print("=" * (len(grid) + 2))
+
+        for row in range(7):
+            if self.pattern is not None:
+                print("|" + "".join(GRAPH_SHADES[self.pattern[week * 7 + row]] for week in range(len(grid))) + "|")
+                continue
+            bit = 1 << row
+            print("|" + "".join("█" if mask & bit else " " for mask in grid) + "|")
+
+        print("=" * (len(grid) + 2))
+        print(f"Pattern size: 7 rows × {len(grid)} columns")
+
+    def simulate_graph(self, ansi: bool = None):
+        """Print the contribution graph as it would look with the drawing added.
+
+        Your commits reachable from HEAD are combined with the planned ones
+        and shaded like the graph does, over the 53 weeks ending this week,
+        or starting at the drawing if it does not fall within them.
+        """
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        first_day = today - timedelta(days=(today.weekday() + 1) % 7, weeks=52)
+        dates = list(self._iter_commit_dates())
+        if dates and (dates[0] < first_day or dates[-1] >= first_day + timedelta(days=GRAPH_DAYS)):
+            first_day = self.start_date - timedelta(days=(self.start_date.weekday() + 1) % 7)
+
+        author = _author_email()
+        existing = _commits_per_day('HEAD', first_day, author) if _rev_parse('HEAD') else {}
+        counts = [existing.get((first_day + timedelta(days=offset)).strftime('%Y-%m-%d'), 0)
+                  for offset in range(GRAPH_DAYS)]
+        mine = sum(counts)
+
+        busiest = 0
+        if self.top_up:
+            end = (self.start_date + timedelta(days=GRAPH_DAYS)).strftime('%Y-%m-%d')
+            busiest = max([count for day, count in existing.items()
+                           if self.start_date.strftime('%Y-%m-%d') <= day < end], default=0)
+        target = max(self.commits_per_date, busiest)
+        for commit_date, level in zip(dates, self._iter_cell_levels()):
+            offset = (commit_date - first_day).days
+            if 0 <= offset < GRAPH_DAYS:
+                # Like _commit_plan, only the commits the day is still missing get written
+                counts[offset] += max(level_commits(level, target, busiest >= target) - counts[offset], 0)
+
+        if ansi is None:
+            ansi = sys.stdout.isatty() and 'NO_COLOR' not in os.environ
+        print(f"\nSimulated contribution graph for {author} "
+              f"({mine} existing commits, {sum(counts) - mine} planned):")
+        print(render_graph(contribution_levels(counts), first_day, ansi))
+
+    def run(self, preview_only: bool = False, simulate: bool = False):
         """Main execution method."""
         print(f"Drawing word: '{self.word}'")
 
-        grid = self._create_pattern_grid()
-        commit_dates = self._get_commit_dates(grid)
+        total_commits = self._count_commits(self._iter_commit_dates())
 
         self.draw_preview()
+        if simulate:
+            self.simulate_graph()
 
-        if not commit_dates:
+        if not total_commits:
             print("No commits to create. Exiting.")
             return
 
-        total_commits = len(commit_dates) * self.commits_per_date
-
         if preview_only:
             print(f"Preview mode: Would create {total_commits} commits ({self.commits_per_date} per date)")
             return
 
-        print(f"\nWill create {total_commits} commits ({self.commits_per_date} per date) starting from {self.start_date.strftime('%Y-%m-%d')}")
+        if self.base and not _rev_parse(self.base):
+            print(f"Error: Unknown base revision '{self.base}'")
+            sys.exit(1)
+
+        if self.top_up:
+            print(f"\nWill top up {self._count_commit_dates()} lit days starting from {self.start_date.strftime('%Y-%m-%d')}")
+        else:
+            print(f"\nWill create {total_commits} commits ({self.commits_per_date} per date) starting from {self.start_date.strftime('%Y-%m-%d')}")
 
         response = input("Continue? (y/N): ").strip().lower()
         if response != 'y':
@@ -441,31 +2250,191 @@ class GitHubWordDrawer:
             return
 
         branch_name = self.create_branch()
-        self.create_commits(commit_dates)
+        self.create_commits(self._iter_commit_dates(), branch_name)
+
+        if self.maintain:
+            maintain_repository([branch_name])
 
         print(f"\nDone! Your word '{self.word}' has been drawn on branch '{branch_name}'")
         print("Push to GitHub to see the contribution graph pattern.")
 
     @staticmethod
-    def clear_word_branches():
-        """Delete all branches with 'word-' prefix."""
+    def run_batch(manifest: str, backend: str = 'auto', preview_only: bool = False, jobs: int = 1,
+                  content: str = 'counter', report: bool = False, bulk: bool = False,
+                  maintain: bool = False, replace: bool = False):
+        """Draw every entry of a manifest in one run and publish all branches together.
+
+        With one job all chains are built in one backend session, so processes
+        and objects shared between entries are reused. With more jobs each
+        branch is built in its own worker process. Either way every branch
+        ref is updated in a single transaction at the end.
+        """
+        try:
+            entries = load_manifest(manifest)
+        except (OSError, ValueError) as e:
+            print(f"Error reading manifest: {e}")
+            sys.exit(1)
+
+        backend = select_backend(backend)
+        if not isinstance(backend, ChainBackend):
+            print(f"Error: the {backend.name} backend checks branches out and cannot run batches")
+            sys.exit(1)
+
+        drawers = []
+        try:
+            for entry in entries:
+                drawer = GitHubWordDrawer(entry['word'], entry.get('start_date') or None,
+                                          int(entry.get('commits_per_date') or 5), backend,
+                                          base=entry.get('base') or None,
+                                          orphan=str(entry.get('orphan', '')).lower() in ('1', 'true', 'yes'),
+                                          content=entry.get('content') or content, replace=replace)
+                drawers.append((drawer, drawer._branch_name(entry.get('branch') or None)))
+        except ValueError as e:
+            print(f"Error in manifest: {e}")
+            sys.exit(1)
+
+        total_commits = 0
+        print(f"Batch of {len(drawers)} drawings from {manifest}:")
+        for drawer, branch_name in drawers:
+            commits = drawer._count_commit_dates() * drawer.commits_per_date
+            total_commits += commits
+            print(f"  - {branch_name}: '{drawer.word}' from {drawer.start_date.strftime('%Y-%m-%d')}, "
+                  f"{commits} commits ({drawer.commits_per_date} per date)")
+
+        if preview_only:
+            print(f"Preview mode: Would create {total_commits} commits")
+            return
+
+        response = input(f"\nCreate {total_commits} commits with the {backend.name} backend? (y/N): ").strip().lower()
+        if response != 'y':
+            print("Cancelled.")
+            return
+
+        # branch -> [tip before the run, commit the chain starts from, tip to build on];
+        # only the first entry of a branch decides its base
+        tips = {}
         try:
-            # Get all local branches
-            result = subprocess.run(['git', 'branch'], capture_output=True, text=True, check=True)
-            branches = [line.strip().lstrip('* ') for line in result.stdout.splitlines()]
+            for drawer, branch_name in drawers:
+                if branch_name not in tips:
+                    old_tip = _rev_parse(f"refs/heads/{branch_name}")
+                    start = drawer._resolve_parent(old_tip)
+                    drawer._check_replace(branch_name, old_tip, start)
+                    tips[branch_name] = [old_tip, start, start]
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
 
-            # Filter word- branches
-            word_branches = [branch for branch in branches if branch.startswith('word-')]
+        with sigterm_as_interrupt(), bulk_session() if bulk else contextlib.nullcontext():
+            if jobs > 1:
+                # Branches are independent: build each one's chain in its own process
+                groups = {}
+                for drawer, branch_name in drawers:
+                    groups.setdefault(branch_name, []).append({
+                        'word': drawer.word, 'start_date': drawer.start_date.strftime('%Y-%m-%d'),
+                        'commits_per_date': drawer.commits_per_date, 'content': drawer.content})
+
+                with ProcessPoolExecutor(max_workers=jobs) as pool:
+                    futures = {pool.submit(_build_branch_chain, backend.name, tips[branch_name][2], entries):
+                               branch_name for branch_name, entries in groups.items()}
+                    for future in as_completed(futures):
+                        branch_name = futures[future]
+                        tips[branch_name][2] = future.result()
+                        print(f"Built {len(groups[branch_name])} words for {branch_name}")
+            else:
+                backend.open()
+                try:
+                    for drawer, branch_name in drawers:
+                        tips[branch_name][2] = backend.build_chain(drawer, drawer._iter_commit_dates(),
+                                                                   tips[branch_name][2])
+                        print(f"Built '{drawer.word}' for {branch_name}")
+                finally:
+                    backend.close()
+
+            updates = [(branch_name, new_tip, old_tip) for branch_name, (old_tip, start, new_tip) in tips.items()
+                       if new_tip and new_tip != start]
+            if updates:
+                backend.update_refs(f"word drawer: batch {os.path.basename(manifest)}", updates)
+                for branch_name, new_tip, old_tip in updates:
+                    _sync_checked_out_branch(branch_name, old_tip, new_tip)
+
+        if report:
+            for branch_name, (old_tip, start, new_tip) in tips.items():
+                if new_tip and new_tip != start:
+                    objects, pack_size = _pack_report(new_tip, start)
+                    print(f"{branch_name}: {objects} new objects, {pack_size} bytes packed")
+
+        if maintain and updates:
+            maintain_repository([branch_name for branch_name, _, _ in updates])
+
+        print(f"\nDone! Drew {len(drawers)} words on {len(updates)} branches ({total_commits} commits)")
 
-            if not word_branches:
+    @staticmethod
+    def clear_remote_word_branches(remote: str):
+        """Delete every word-* branch on a remote with a single push.
+
+        Matching remote-tracking refs are then pruned in one update-ref
+        transaction, including stale ones the remote no longer has.
+        """
+        try:
+            result = subprocess.run(['git', 'ls-remote', '--heads', remote, 'refs/heads/word-*'],
+                                    capture_output=True, text=True, check=True)
+            remote_refs = [line.split('\t', 1)[1] for line in result.stdout.splitlines()]
+
+            if not remote_refs:
+                print(f"No word-* branches found on '{remote}'.")
+            else:
+                print(f"Found {len(remote_refs)} word-* branches on '{remote}':")
+                for ref in remote_refs:
+                    print(f"  - {ref[len('refs/heads/'):]}")
+
+                response = input(f"\nDelete all {len(remote_refs)} word-* branches from '{remote}'? (y/N): ").strip().lower()
+                if response != 'y':
+                    print("Cancelled.")
+                    return
+
+                subprocess.run(['git', 'push', '--quiet', remote] + [f":{ref}" for ref in remote_refs],
+                               check=True)
+                print(f"Deleted {len(remote_refs)} word-* branches from '{remote}'")
+
+            result = subprocess.run(['git', 'for-each-ref', '--format=%(objectname) %(refname)',
+                                     f"refs/remotes/{remote}/word-*"],
+                                    capture_output=True, text=True, check=True)
+            tracking_refs = [line.split(' ', 1) for line in result.stdout.splitlines()]
+            if tracking_refs:
+                commands = "".join(f"delete {ref} {sha}\n" for sha, ref in tracking_refs)
+                subprocess.run(['git', 'update-ref', '--stdin'], input=commands, text=True, check=True)
+                print(f"Pruned {len(tracking_refs)} '{remote}/word-*' remote-tracking refs")
+
+        except subprocess.CalledProcessError as e:
+            print(f"Error clearing branches on '{remote}': {e}")
+            sys.exit(1)
+
+    @staticmethod
+    def clear_word_branches(reclaim: bool = False):
+        """Delete all branches with 'word-' prefix.
+
+        The branches are listed with one for-each-ref and deleted in one
+        update-ref transaction, together with the cached drawings. With
+        reclaim, their reflogs are expired, the objects nothing else
+        reaches are pruned and any commit-graph is rewritten without them.
+        """
+        try:
+            result = subprocess.run(['git', 'for-each-ref', '--format=%(objectname) %(refname)',
+                                     'refs/heads/word-*', CACHE_REF_PREFIX],
+                                    capture_output=True, text=True, check=True)
+            refs = [line.split(' ', 1) for line in result.stdout.splitlines()]
+            word_refs = [(sha, ref) for sha, ref in refs if ref.startswith('refs/heads/')]
+            cache_refs = [(sha, ref) for sha, ref in refs if ref.startswith(CACHE_REF_PREFIX)]
+
+            if not word_refs and not cache_refs:
                 print("No word-* branches found to delete.")
                 return
 
-            print(f"Found {len(word_branches)} word-* branches:")
-            for branch in word_branches:
-                print(f"  - {branch}")
+            print(f"Found {len(word_refs)} word-* branches and {len(cache_refs)} cached drawings:")
+            for _, ref in word_refs:
+                print(f"  - {ref[len('refs/heads/'):]}")
 
-            response = input(f"\nDelete all {len(word_branches)} word-* branches? (y/N): ").strip().lower()
+            response = input(f"\nDelete all {len(word_refs)} word-* branches and the drawing cache? (y/N): ").strip().lower()
             if response != 'y':
                 print("Cancelled.")
                 return
@@ -490,17 +2459,26 @@ class GitHubWordDrawer:
                         print("Please manually switch branches before running clear-branches")
                         return
 
-            # Delete branches
-            deleted_count = 0
-            for branch in word_branches:
-                try:
-                    subprocess.run(['git', 'branch', '-D', branch], check=True, capture_output=True)
-                    deleted_count += 1
-                    print(f"Deleted branch: {branch}")
-                except subprocess.CalledProcessError as e:
-                    print(f"Failed to delete branch {branch}: {e}")
-
-            print(f"\nSuccessfully deleted {deleted_count}/{len(word_branches)} word-* branches")
+            # Delete every branch in one transaction, checked against the listed values
+            size_before = _objects_size() if reclaim else 0
+            commands = "".join(f"delete {ref} {sha}\n" for sha, ref in word_refs + cache_refs)
+            subprocess.run(['git', 'update-ref', '--stdin'], input=commands, text=True, check=True)
+            print(f"\nSuccessfully deleted {len(word_refs)} word-* branches and {len(cache_refs)} cached drawings")
+
+            if reclaim:
+                print("Expiring reflogs and pruning unreachable objects...")
+                subprocess.run(['git', 'reflog', 'expire', '--expire-unreachable=now', '--all'], check=True)
+                subprocess.run(['git', 'repack', '-a', '-d', '-q'], check=True)
+                subprocess.run(['git', 'prune', '--expire=now'], check=True)
+                # A commit-graph written earlier still lists the pruned commits
+                info = os.path.join(_common_dir(), 'objects', 'info')
+                if os.path.exists(os.path.join(info, 'commit-graph')) or \
+                        os.path.exists(os.path.join(info, 'commit-graphs')):
+                    print("Rewriting commit-graph...")
+                    subprocess.run(['git', 'commit-graph', 'write', '--reachable'], check=True)
+                size_after = _objects_size()
+                print(f"Reclaimed {size_before - size_after} bytes "
+                      f"({size_before} -> {size_after} bytes in .git/objects)")
 
         except subprocess.CalledProcessError as e:
             print(f"Error clearing branches: {e}")
@@ -509,30 +2487,119 @@ class GitHubWordDrawer:
 
 def main():
     parser = argparse.ArgumentParser(description="Draw words on GitHub contribution graph")
-    parser.add_argument("word", nargs="?", help="Word to draw (letters and spaces only)")
-    parser.add_argument("--start-date", help="Start date (YYYY-MM-DD), defaults to one year ago")
+    parser.add_argument("word", nargs="?", help="Word to draw (letters and spaces, or whatever --font covers)")
+    start = parser.add_mutually_exclusive_group()
+    start.add_argument("--start-date", help="Start date (YYYY-MM-DD), defaults to one year ago")
+    start.add_argument("--auto-start", action="store_true",
+                       help="Start on the Sunday in the past year where the word overlaps the fewest of your commits")
     parser.add_argument("--preview", action="store_true", help="Show preview only, don't create commits")
+    parser.add_argument("--simulate", action="store_true",
+                        help="Also show how your contribution graph would look with the drawing added")
     parser.add_argument("--commits-per-date", type=int, default=5, help="Number of commits per date (default: 5)")
     parser.add_argument("--clear-branches", action="store_true", help="Delete all word-* branches and exit")
+    parser.add_argument("--remote", metavar="NAME",
+                        help="With --clear-branches, also delete the word-* branches on this remote in one push")
+    parser.add_argument("--reclaim", action="store_true",
+                        help="With --clear-branches, also expire reflogs and prune the freed objects")
+    parent = parser.add_mutually_exclusive_group()
+    parent.add_argument("--base", metavar="REV",
+                        help="Draw on top of this commit instead of the branch tip or HEAD")
+    parent.add_argument("--orphan", action="store_true",
+                        help="Draw as a new history with no parent commit")
+    parser.add_argument("--replace", action="store_true",
+                        help="With --base or --orphan, allow discarding the history of an existing branch")
+    parser.add_argument("--font", metavar="FILE",
+                        help="Draw with a BDF or simple bitmap font; it is compiled once into a cached glyph atlas")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--pattern", metavar="FILE",
+                        help="Draw a pattern file instead of a word: up to 7 rows of ' ░▒▓█' (or 0-4) "
+                             "shade levels, each lit cell getting the fewest commits that reach its shade")
+    source.add_argument("--image", metavar="FILE",
+                        help="Draw an image instead of a word: PBM or PGM, or PNG and more with Pillow "
+                             "(needs NumPy); darker areas get darker shades")
+    parser.add_argument("--weeks", type=int,
+                        help="With --image, number of week columns (default: keep the aspect ratio, at most 53)")
+    parser.add_argument("--no-dither", action="store_true",
+                        help="With --image, round each cell to the nearest shade instead of dithering")
+    parser.add_argument("--top-up", action="store_true",
+                        help="Bring every lit day up to the darkest shade given your existing commits, "
+                             "instead of adding --commits-per-date to each")
+    parser.add_argument("--content", choices=CONTENT_STRATEGIES, default='counter',
+                        help="What each commit writes: a unique counter text, nothing (empty commits), "
+                             "one constant blob, or a growing log (default: counter)")
+    parser.add_argument("--report", action="store_true",
+                        help="After drawing, print the new object count and the size of the pack to push")
+    parser.add_argument("--bulk", action="store_true",
+                        help="While drawing, skip git hooks, disable auto gc and relax fsync; "
+                             "everything is restored and synced to disk at the end")
+    parser.add_argument("--maintain", action="store_true",
+                        help="After drawing, repack and write the commit-graph and multi-pack-index")
+    parser.add_argument("--batch", metavar="MANIFEST",
+                        help="Draw every entry of a JSONL or CSV manifest (word, start_date, commits_per_date, branch)")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="With --batch, build up to N branches in parallel processes (default: 1)")
+    parser.add_argument("--backend", choices=BACKENDS, default='auto',
+                        help="Commit engine: git add/commit per commit, a single fast-import stream, "
+                             "index-free plumbing commands, in-process object writes, "
+                             "or the fastest one this git supports (default: auto)")
 
     args = parser.parse_args()
 
     # Handle clear-branches option
     if args.clear_branches:
-        GitHubWordDrawer.clear_word_branches()
+        # Remote first, so pruned remote-tracking refs no longer hold objects to reclaim
+        if args.remote:
+            GitHubWordDrawer.clear_remote_word_branches(args.remote)
+        GitHubWordDrawer.clear_word_branches(args.reclaim)
+        return
+
+    if args.batch:
+        GitHubWordDrawer.run_batch(args.batch, args.backend, args.preview, args.jobs,
+                                   args.content, args.report, args.bulk, args.maintain, args.replace)
         return
 
-    # Check if word is provided when not using clear-branches
+    # A pattern or image is drawn under the word given, or else under its file name
+    pattern = None
+    if args.pattern or args.image:
+        try:
+            if args.pattern:
+                pattern = load_pattern(args.pattern)
+            else:
+                pattern = load_image(args.image, args.weeks, not args.no_dither)
+        except (OSError, ValueError) as e:
+            print(f"Error reading {'pattern' if args.pattern else 'image'}: {e}")
+            sys.exit(1)
+        args.word = args.word or os.path.splitext(os.path.basename(args.pattern or args.image))[0]
+        # Below 4 commits for the darkest cells, levels 1-3 cannot all be told apart
+        if args.commits_per_date < 4 and any(0 < level < 4 for level in pattern):
+            print(f"Note: shaded cells need at least 4 commits per date; using 4 instead of {args.commits_per_date}")
+            args.commits_per_date = 4
+
+    # Check if word is provided when not using clear-branches or --batch
     if not args.word:
-        parser.error("word argument is required unless using --clear-branches")
+        parser.error("word argument is required unless using --clear-branches, --batch, --pattern or --image")
 
-    # Validate word contains only letters and spaces
-    if not all(c.isalpha() or c.isspace() for c in args.word):
-        print("Error: Word can only contain letters and spaces")
-        sys.exit(1)
+    font = None
+    if args.font:
+        try:
+            font = load_font(args.font)
+        except (OSError, ValueError) as e:
+            print(f"Error loading font: {e}")
+            sys.exit(1)
+
+    # Validate the font has a glyph for every character of the word
+    if pattern is None:
+        missing = sorted({c for c in args.word if not c.isspace() and not (font or DEFAULT_FONT).covers(c)})
+        if missing:
+            print(f"Error: the {(font or DEFAULT_FONT).name} font has no glyph for: {' '.join(missing)}")
+            sys.exit(1)
 
-    drawer = GitHubWordDrawer(args.word, args.start_date, args.commits_per_date)
-    drawer.run(args.preview)
+    drawer = GitHubWordDrawer(args.word, 'auto' if args.auto_start else args.start_date,
+                              args.commits_per_date, args.backend, font=font,
+                              base=args.base, orphan=args.orphan, content=args.content, report=args.report,
+                              bulk=args.bulk, maintain=args.maintain, top_up=args.top_up, pattern=pattern,
+                              replace=args.replace)
+    drawer.run(args.preview, args.simulate)
 
 
 if __name__ == "__main__":